@@ -1,13 +1,18 @@
 import streamlit as st
+import asyncio
+import bisect
 import datetime
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from zoneinfo import ZoneInfo
+import hashlib
 import json
 import os
 from dotenv import load_dotenv
 from mistralai import Mistral
 
+from config.settings import CACHE_DIR, CACHE_CALENDAR_HOURS
+
 # Charger les variables d'environnement
 load_dotenv()
 
@@ -20,57 +25,105 @@ SERVICE_ACCOUNT_FILE = os.getenv('GOOGLE_SERVICE_ACCOUNT_FILE', 'service_account
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 CALENDAR_ID = os.getenv('GOOGLE_CALENDAR_ID')
 
-credentials = service_account.Credentials.from_service_account_file(
-    SERVICE_ACCOUNT_FILE, scopes=SCOPES
-)
-calendar_service = build('calendar', 'v3', credentials=credentials)
+@st.cache_resource
+def get_credentials():
+    """Lit et parse le JSON du compte de service une seule fois par processus."""
+    with open(SERVICE_ACCOUNT_FILE) as f:
+        info = json.load(f)
+    return service_account.Credentials.from_service_account_info(info, scopes=SCOPES)
+
+@st.cache_resource
+def get_calendar_service():
+    """Crée le client Google Calendar une seule fois par processus (réutilisé entre les reruns Streamlit)."""
+    return build('calendar', 'v3', credentials=get_credentials(), cache_discovery=False)
 
+@st.cache_data(ttl=CACHE_CALENDAR_HOURS * 3600)
 def get_events(start_date, end_date):
-    start_iso = start_date.isoformat() + "T00:00:00Z"
-    end_iso = end_date.isoformat() + "T23:59:59Z"
-    events = calendar_service.events().list(
-        calendarId=CALENDAR_ID,
-        timeMin=start_iso,
-        timeMax=end_iso,
-        singleEvents=True,
-        orderBy="startTime"
-    ).execute()
-    return events.get("items", [])
+    start_iso = datetime.datetime.combine(start_date, datetime.time.min, tzinfo=PARIS).isoformat()
+    end_iso = datetime.datetime.combine(end_date, datetime.time.max, tzinfo=PARIS).isoformat()
+    service = get_calendar_service()
+    items = []
+    page_token = None
+    while True:
+        # Seuls start/end sont consommés en aval : le masque fields= évite de
+        # rapatrier le reste du payload, et la pagination évite la troncature
+        # silencieuse à 250 résultats
+        events = service.events().list(
+            calendarId=CALENDAR_ID,
+            timeMin=start_iso,
+            timeMax=end_iso,
+            timeZone="Europe/Paris",
+            singleEvents=True,
+            orderBy="startTime",
+            maxResults=2500,
+            fields="items(start,end),nextPageToken",
+            pageToken=page_token
+        ).execute()
+        items.extend(events.get("items", []))
+        page_token = events.get("nextPageToken")
+        if not page_token:
+            return items
 
 def parse_event_datetime(event_part):
-    if "dateTime" in event_part:
-        return datetime.datetime.fromisoformat(
-            event_part["dateTime"].replace("Z", "+00:00")
-        ).astimezone(PARIS)
-    if "date" in event_part:
-        return datetime.datetime.fromisoformat(event_part["date"] + "T00:00:00").replace(tzinfo=PARIS)
-    raise ValueError("Événement sans date détecté")
-
-def is_free(start, end, events):
-    for e in events:
-        e_start = parse_event_datetime(e["start"])
-        e_end = parse_event_datetime(e["end"])
-        if start < e_end and end > e_start:
-            return False
-    return True
-
-def create_event(summary, start, end, description):
-    event = {
+    dt = event_part.get("dateTime")
+    if dt is not None:
+        # fromisoformat accepte le suffixe 'Z' depuis Python 3.11
+        return datetime.datetime.fromisoformat(dt).astimezone(PARIS)
+    # Événement "journée entière" : seul 'date' est présent
+    return datetime.datetime.combine(
+        datetime.date.fromisoformat(event_part["date"]), datetime.time.min, tzinfo=PARIS
+    )
+
+def parse_events(events):
+    """Parse chaque événement une seule fois, trie et fusionne les intervalles occupés."""
+    intervals = sorted(
+        ((parse_event_datetime(e["start"]), parse_event_datetime(e["end"])) for e in events),
+        key=lambda iv: iv[0],
+    )
+    merged = []
+    for iv_start, iv_end in intervals:
+        if merged and iv_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], iv_end))
+        else:
+            merged.append((iv_start, iv_end))
+    starts = [iv[0] for iv in merged]
+    return merged, starts
+
+def is_free(start, end, parsed, starts):
+    """Teste un créneau contre les intervalles occupés triés en O(log M)."""
+    idx = bisect.bisect_left(starts, end)
+    # Les intervalles étant disjoints et triés, seul celui juste avant `end`
+    # peut encore chevaucher [start, end)
+    return idx == 0 or parsed[idx - 1][1] <= start
+
+def build_event_body(summary, start, end, description):
+    return {
         "summary": summary,
         "description": description,
         "start": {"dateTime": start.isoformat(), "timeZone": "Europe/Paris"},
         "end": {"dateTime": end.isoformat(), "timeZone": "Europe/Paris"}
     }
-    return calendar_service.events().insert(calendarId=CALENDAR_ID, body=event).execute()
 
+# L'endpoint batch de Google Calendar accepte au plus 50 opérations par requête
+BATCH_SIZE = 50
+
+def insert_events_batch(event_bodies):
+    """Insère les événements par lots de 50 via l'endpoint batch HTTP de Google."""
+    service = get_calendar_service()
+    for i in range(0, len(event_bodies), BATCH_SIZE):
+        batch = service.new_batch_http_request()
+        for body in event_bodies[i:i + BATCH_SIZE]:
+            batch.add(service.events().insert(calendarId=CALENDAR_ID, body=body))
+        batch.execute()
+
+
+JOURS_SEMAINE = ["Lundi","Mardi","Mercredi","Jeudi","Vendredi","Samedi","Dimanche"]
+DAY_IDX = {name: i for i, name in enumerate(JOURS_SEMAINE)}
 
 # Convertir numéro de semaine + jour → vraie date
 def find_day_date(start_date, week_number, day_name):
-    days = ["Lundi","Mardi","Mercredi","Jeudi","Vendredi","Samedi","Dimanche"]
-    idx = days.index(day_name)
-
     week_start = start_date + datetime.timedelta(weeks=week_number - 1)
-    return week_start + datetime.timedelta(days=idx)
+    return week_start + datetime.timedelta(days=DAY_IDX[day_name])
 
 
 # =========================
@@ -82,10 +135,13 @@ objectif = st.selectbox("Objectif", ["10 km", "Semi-marathon (21 km)", "Marathon
 nb_weeks = st.slider("Durée du plan", 3, 16, 8)
 seances_semaine = st.slider("Séances par semaine", 2, 7, 4)
 heures_pref = st.time_input("Heure préférée", datetime.time(18, 0))
-jours_pref = st.multiselect("Jours préférés", 
-    ["Lundi","Mardi","Mercredi","Jeudi","Vendredi","Samedi","Dimanche"],
+jours_pref = st.multiselect("Jours préférés",
+    JOURS_SEMAINE,
     default=["Mardi","Jeudi","Samedi"]
 )
+# Clé canonique : triée dans l'ordre de la semaine et hashable, pour que
+# ["Mardi","Jeudi"] et ["Jeudi","Mardi"] partagent la même entrée de cache
+jours_key = tuple(sorted(frozenset(jours_pref), key=DAY_IDX.get))
 
 # =========================
 # GENERATION AI
@@ -94,14 +150,62 @@ jours_pref = st.multiselect("Jours préférés",
 from mistralai import Mistral
 import json
 
-def generate_training_plan(objectif, nb_weeks, seances_semaine, jours_pref):
+# Cache disque des réponses LLM : survit aux redémarrages de Streamlit,
+# contrairement à st.cache_data (désactivable avec LLM_DISK_CACHE=0)
+LLM_DISK_CACHE = os.getenv('LLM_DISK_CACHE', '1') == '1'
+
+# Schéma strict miroir du bloc "Format JSON" du prompt : sorties déterministes
+# (temperature=0) et toujours parsables par json.loads, donc cachables sans risque
+PLAN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "weeks": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "week_number": {"type": "integer"},
+                    "sessions": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "day": {"type": "string"},
+                                "type": {"type": "string"},
+                                "duration_minutes": {"type": "integer"},
+                                "description": {"type": "string"}
+                            },
+                            "required": ["day", "type", "duration_minutes", "description"],
+                            "additionalProperties": False
+                        }
+                    }
+                },
+                "required": ["week_number", "sessions"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["weeks"],
+    "additionalProperties": False
+}
+
+@st.cache_resource
+def get_mistral_client():
+    """Crée le client Mistral une seule fois par processus (connexion HTTP réutilisée entre les reruns)."""
+    api_key = os.getenv('MISTRAL_API_KEY')
+    if not api_key:
+        raise ValueError("MISTRAL_API_KEY doit être définie dans le fichier .env")
+    return Mistral(api_key=api_key)
 
-    prompt = f"""
+# Gabarit figé : structure byte-identique d'un appel à l'autre (seules les
+# valeurs insérées changent), ce qui rend le préfixe éligible au cache de
+# prompt côté fournisseur et stabilise la clé du cache disque
+PROMPT_TEMPLATE = """
     Crée un plan d'entraînement structuré pour un coureur.
     Objectif: {objectif}
     Durée: {nb_weeks} semaines
     Séances par semaine: {seances_semaine}
-    Jours préférés: {jours_pref}
+    Jours préférés: {jours_str}
 
     Format JSON strict:
     {{
@@ -120,62 +224,135 @@ def generate_training_plan(objectif, nb_weeks, seances_semaine, jours_pref):
       ]
     }}
     """
-    api_key = os.getenv('MISTRAL_API_KEY')
-    if not api_key:
-        raise ValueError("MISTRAL_API_KEY doit être définie dans le fichier .env")
-    
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def generate_training_plan(objectif, nb_weeks, seances_semaine, jours_pref):
+
+    # jours_pref arrive déjà canonicalisé (voir jours_key)
+    jours_str = ", ".join(jours_pref)
+    prompt = PROMPT_TEMPLATE.format(
+        objectif=objectif,
+        nb_weeks=nb_weeks,
+        seances_semaine=seances_semaine,
+        jours_str=jours_str,
+    )
     model = "mistral-small"
 
-    client = Mistral(api_key=api_key)
+    cache_path = CACHE_DIR / f"llm_{hashlib.sha256(f'{model}|{prompt}|0'.encode()).hexdigest()}.json"
+    if LLM_DISK_CACHE and cache_path.exists():
+        return cache_path.read_text(encoding="utf-8")
 
-    chat_response = client.chat.complete(
-        model = model,
-        messages = [
+    client = get_mistral_client()
+
+    # Streaming : les tokens sont accumulés au fil de l'eau au lieu d'attendre
+    # la complétion entière avant le premier octet
+    chunks = []
+    with client.chat.stream(
+        model=model,
+        messages=[
             {
                 "role": "user",
                 "content": prompt,
-                
             },
         ],
-        response_format={"type": "json_object"}
-    )
-
-    return chat_response.choices[0].message.content
-
-def find_free_slot(preferred_date, preferred_time, duration_minutes, events, search_range_hours=2):
+        temperature=0,
+        max_tokens=4000,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {
+                "name": "training_plan",
+                "schema": PLAN_SCHEMA,
+                "strict": True,
+            },
+        }
+    ) as event_stream:
+        for event in event_stream:
+            delta = event.data.choices[0].delta.content
+            if delta:
+                chunks.append(delta)
+
+    content = "".join(chunks)
+
+    if LLM_DISK_CACHE:
+        # Écriture atomique : fichier temporaire puis os.replace
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+
+    return content
+
+def free_gaps(window_start, window_end, parsed, starts):
+    """Liste les trous libres de [window_start, window_end) en une passe sur les intervalles occupés triés."""
+    gaps = []
+    cursor = window_start
+    lo = max(0, bisect.bisect_left(starts, window_start) - 1)
+    hi = bisect.bisect_left(starts, window_end)
+    for e_start, e_end in parsed[lo:hi]:
+        if e_end <= cursor:
+            continue
+        if e_start > cursor:
+            gaps.append((cursor, min(e_start, window_end)))
+        cursor = e_end
+        if cursor >= window_end:
+            break
+    if cursor < window_end:
+        gaps.append((cursor, window_end))
+    return gaps
+
+def find_free_slot(preferred_date, preferred_time, duration_minutes, parsed, starts, search_range_hours=2):
     """
-    Cherche un créneau libre autour de l'heure préférée, sinon le lendemain.
+    Cherche un créneau libre autour de l'heure préférée, sinon les jours suivants.
+    Balaye les trous libres de la fenêtre en une seule passe au lieu de sonder
+    heure par heure, et avance jour par jour sans récursion.
     - preferred_date : date de la séance
     - preferred_time : heure préférée (datetime.time)
     - duration_minutes : durée de la séance
-    - events : liste des événements existants
-    - search_range_hours : nombre d'heures avant/après l'heure préférée à tester
+    - parsed, starts : intervalles occupés triés (voir parse_events)
+    - search_range_hours : nombre d'heures avant/après l'heure préférée à considérer
     """
-    start_dt = datetime.datetime.combine(preferred_date, preferred_time, tzinfo=PARIS)
-    end_dt = start_dt + datetime.timedelta(minutes=duration_minutes)
-
-    # Vérifier autour de l'heure préférée
-    for delta in range(search_range_hours + 1):
-        for sign in [1, -1]:  # essayer après (+) puis avant (-)
-            candidate_start = start_dt + datetime.timedelta(hours=sign * delta)
-            candidate_end = candidate_start + datetime.timedelta(minutes=duration_minutes)
-            if is_free(candidate_start, candidate_end, events):
-                return candidate_start, candidate_end
-
-    # Si pas trouvé sur ce jour, passer au jour suivant
-    next_day = preferred_date + datetime.timedelta(days=1)
-    return find_free_slot(next_day, preferred_time, duration_minutes, events, search_range_hours)
-
+    duration = datetime.timedelta(minutes=duration_minutes)
+    margin = datetime.timedelta(hours=search_range_hours)
+    date = preferred_date
+    while True:
+        preferred_dt = datetime.datetime.combine(date, preferred_time, tzinfo=PARIS)
+        window_start = preferred_dt - margin
+        window_end = preferred_dt + margin + duration
+        best = None
+        for gap_start, gap_end in free_gaps(window_start, window_end, parsed, starts):
+            if gap_end - gap_start < duration:
+                continue
+            # Clamp direct vers le début valide le plus proche de l'heure
+            # préférée (avant ou après), sans sonder d'offsets
+            candidate = min(max(preferred_dt, gap_start), gap_end - duration)
+            score = abs(candidate - preferred_dt)
+            if best is None or score < best[0]:
+                best = (score, candidate)
+        if best is not None:
+            start = best[1]
+            return start, start + duration
+        date += datetime.timedelta(days=1)
+
+
+
+async def fetch_plan_and_events(objectif, nb_weeks, seances_semaine, jours_pref, start_date, end_date):
+    """Lance la génération LLM et la lecture du calendrier en parallèle : deux appels indépendants."""
+    return await asyncio.gather(
+        asyncio.to_thread(generate_training_plan, objectif, nb_weeks, seances_semaine, jours_pref),
+        asyncio.to_thread(get_events, start_date, end_date),
+    )
 
 
 if st.button("Générer le plan et l'ajouter dans le calendrier"):
-    raw = generate_training_plan(objectif, nb_weeks, seances_semaine, jours_pref)
-    plan = json.loads(raw)
-
     start_date = datetime.date.today()
     end_date = start_date + datetime.timedelta(weeks=nb_weeks)
-    events = get_events(start_date, end_date)
 
+    raw, events = asyncio.run(fetch_plan_and_events(
+        objectif, nb_weeks, seances_semaine, jours_key, start_date, end_date
+    ))
+    plan = json.loads(raw)
+    parsed, starts = parse_events(events)
+
+    event_bodies = []
     for week in plan["weeks"]:
         for session in week["sessions"]:
             day_name = session["day"]
@@ -186,15 +363,22 @@ if st.button("Générer le plan et l'ajouter dans le calendrier"):
             date = find_day_date(start_date, week["week_number"], day_name)
 
             # Chercher un créneau libre flexible
-            start, end = find_free_slot(date, heures_pref, duration, events)
+            start, end = find_free_slot(date, heures_pref, duration, parsed, starts)
+
+            # Réserver le créneau en mémoire pour que les séances suivantes
+            # le voient sans re-consulter Google Calendar
+            idx = bisect.bisect_left(starts, start)
+            parsed.insert(idx, (start, end))
+            starts.insert(idx, start)
 
-            # Créer l'événement
-            create_event(
+            event_bodies.append(build_event_body(
                 summary=session["type"],
                 start=start,
                 end=end,
                 description=description
-            )
+            ))
 
+    # Une seule requête HTTP par lot de 50 au lieu d'un aller-retour par séance
+    insert_events_batch(event_bodies)
 
     st.success("✅ Plan complet ajouté dans ton Google Calendar")
@@ -15,9 +15,12 @@ PLANS_DIR = DATA_DIR / "plans"
 USER_DATA_DIR = DATA_DIR / "user_data"
 CACHE_DIR = DATA_DIR / "cache"
 
-# Create directories if they don't exist
-for directory in [DATA_DIR, PLANS_DIR, USER_DATA_DIR, CACHE_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+# Create directories if they don't exist (sentinel file: at most once per checkout)
+_DIRS_SENTINEL = CACHE_DIR / ".initialized"
+if not _DIRS_SENTINEL.exists():
+    for directory in [DATA_DIR, PLANS_DIR, USER_DATA_DIR, CACHE_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
+    _DIRS_SENTINEL.touch()
 
 # API Credentials
 GARMIN_EMAIL = os.getenv('GARMIN_EMAIL')
@@ -86,6 +89,7 @@ HR_ZONES = {
 # Cache settings
 CACHE_GARMIN_HOURS = 1  # Mettre en cache les données Garmin pendant 1h
 CACHE_WEATHER_HOURS = 3
+CACHE_CALENDAR_HOURS = 1  # Mettre en cache les événements Google Calendar pendant 1h
 
 # Timezone
 TIMEZONE = "Europe/Paris"
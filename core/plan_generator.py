@@ -8,9 +8,234 @@ from models import (
 )
 from models.athlete_profile import AthleteProfile
 from config.settings import SEMI_145_PACES
-from utils.pace_calculator import calculate_training_paces_from_vma, calculate_heart_rate_zones, estimate_race_time
-from typing import Optional
+from utils.pace_calculator import (
+    calculate_training_paces_from_vma,
+    calculate_training_paces_from_target,
+    calculate_heart_rate_zones,
+    estimate_race_time
+)
+from typing import Iterator, NamedTuple, Optional
+
+
+def _session_template(session_type, intensity, title, description, **extra) -> TrainingSession:
+    """
+    Prototype de séance : seuls les champs statiques sont renseignés, les champs
+    variables (id, week_number, durées, structure...) sont patchés par
+    model_copy(update=...) à chaque semaine — bien moins coûteux que de
+    repasser par __init__ avec une dizaine de kwargs.
+    """
+    return TrainingSession(
+        id='',
+        week_number=1,
+        day_of_week=1,
+        session_number=1,
+        session_type=session_type,
+        intensity=intensity,
+        title=title,
+        description=description,
+        duration_minutes=1,
+        **extra
+    )
+
+
+# Gabarits construits une seule fois à l'import
+_BASE_S1 = _session_template(SessionType.ENDURANCE, SessionIntensity.EASY,
+                             "Endurance fondamentale", "Course facile à allure conversationnelle")
+_BASE_S2 = _session_template(SessionType.FARTLEK, SessionIntensity.MODERATE,
+                             "Fartlek léger", "Variations d'allure en nature")
+_BASE_S3 = _session_template(SessionType.ENDURANCE, SessionIntensity.EASY,
+                             "Endurance moyenne", "Course facile de récupération")
+_BASE_S4 = _session_template(SessionType.LONG_RUN, SessionIntensity.MODERATE,
+                             "Sortie longue", "Sortie longue à allure confortable", is_key_session=True)
+
+_BUILD_S1 = _session_template(SessionType.INTERVALS, SessionIntensity.VERY_HARD,
+                              "VMA courte", "Intervalles courts à VMA", is_key_session=True)
+_BUILD_S2 = _session_template(SessionType.THRESHOLD, SessionIntensity.HARD,
+                              "Seuil / Allure semi", "Blocs à allure semi-marathon", is_key_session=True)
+_BUILD_S3 = _session_template(SessionType.ENDURANCE, SessionIntensity.EASY,
+                              "Récupération active", "Endurance légère entre les séances intenses")
+_BUILD_S4 = _session_template(SessionType.LONG_RUN, SessionIntensity.MODERATE,
+                              "Sortie longue progressive", "Sortie longue avec finish plus rapide",
+                              is_key_session=True)
 
+_RACE_WEEK_S1 = _session_template(SessionType.ENDURANCE, SessionIntensity.VERY_EASY,
+                                  "Décrassage léger", "Course très facile pour rester actif")
+_RACE_WEEK_S2 = _session_template(SessionType.INTERVALS, SessionIntensity.MODERATE,
+                                  "Rappel VMA court", "Quelques accélérations pour garder jambes vives")
+_RACE_DAY = _session_template(SessionType.RACE, SessionIntensity.VERY_HARD,
+                              "🏁 SEMI-MARATHON - Objectif 1:45",
+                              "Course cible ! Objectif: 4:58/km de moyenne. Bonne chance ! 🚀",
+                              is_key_session=True, can_be_postponed=False, can_be_replaced=False)
+
+_TAPER_S1 = _session_template(SessionType.INTERVALS, SessionIntensity.HARD,
+                              "VMA réduite", "Maintien qualité, volume réduit", is_key_session=True)
+_TAPER_S2 = _session_template(SessionType.TEMPO, SessionIntensity.MODERATE,
+                              "Allure spécifique", "Blocs courts à allure cible", is_key_session=True)
+_TAPER_S3 = _session_template(SessionType.ENDURANCE, SessionIntensity.EASY,
+                              "Endurance facile", "Récupération active")
+_TAPER_S4 = _session_template(SessionType.LONG_RUN, SessionIntensity.EASY,
+                              "Sortie longue allégée", "Sortie longue réduite pour affûtage")
+
+
+class _ZoneSpec(NamedTuple):
+    """
+    Portion de séance sous forme déclarative.
+
+    duration : minutes fixes (int), mises à l'échelle si scale_duration,
+               ou ('long', offset) → (durée_longue + offset) * factor.
+    pace / pace_max : clé (zone, type) résolue via get_pace, ou littéral "M:SS".
+    """
+    description: str
+    duration: object = None
+    distance_km: Optional[float] = None
+    pace: object = ('endurance', 'target')
+    pace_max: object = None
+    hr_zone: Optional[str] = None
+    repetitions: int = 1
+    scale_repetitions: bool = False
+    recovery_minutes: Optional[float] = None
+    scale_duration: bool = False
+
+
+class _SessionSpec(NamedTuple):
+    """
+    Séance sous forme déclarative : gabarit + valeurs de référence.
+
+    duration : minutes (×factor), ou ('long', base, step, cap) →
+               min(base + semaine*step, cap) pour la sortie longue.
+    distance : km (×factor), ou ('long_div', d) → round((durée_longue/d)*factor, 1).
+    """
+    suffix: str
+    template: TrainingSession
+    duration: object
+    distance: object
+    structure: tuple
+    title_pattern: Optional[str] = None
+    day_of_week: Optional[int] = None
+
+
+def _warmup(minutes: int) -> _ZoneSpec:
+    return _ZoneSpec("Échauffement", duration=minutes, pace=('easy', 'target'))
+
+
+def _cooldown(minutes: int = 10) -> _ZoneSpec:
+    return _ZoneSpec("Retour au calme", duration=minutes, pace=('recovery', 'max'))
+
+
+# Table unique des séances par phase : l'interpréteur _generate_sessions
+# remplace les trois générateurs spécialisés
+_SESSION_SPECS = {
+    'base': (
+        _SessionSpec('S1', _BASE_S1, 50, 8.0, (
+            _ZoneSpec("Endurance fondamentale", duration=50, scale_duration=True,
+                      pace=('endurance', 'target'), pace_max="6:15", hr_zone="75-80% FCmax"),
+        )),
+        _SessionSpec('S2', _BASE_S2, 45, 7.5, (
+            _warmup(10),
+            _ZoneSpec("Fartlek (accélérations libres)", duration=25, scale_duration=True,
+                      pace=('tempo', 'target'), hr_zone="80-87% FCmax"),
+            _cooldown(),
+        )),
+        _SessionSpec('S3', _BASE_S3, 40, 6.5, (
+            _ZoneSpec("Endurance", duration=40, scale_duration=True,
+                      pace=('endurance', 'target'), hr_zone="75-80% FCmax"),
+        )),
+        _SessionSpec('S4', _BASE_S4, ('long', 60, 5, 90), ('long_div', 6), (
+            _ZoneSpec("Endurance longue", duration=('long', 0),
+                      pace=('endurance', 'min'), pace_max=('endurance', 'max'),
+                      hr_zone="75-82% FCmax"),
+        ), title_pattern="Sortie longue {d}min"),
+    ),
+    'build': (
+        _SessionSpec('S1', _BUILD_S1, 55, 9.0, (
+            _warmup(15),
+            _ZoneSpec("400m VMA", distance_km=0.4, pace=('vma', 'target'),
+                      hr_zone="95-100% FCmax", repetitions=8, scale_repetitions=True,
+                      recovery_minutes=1.5),
+            _cooldown(),
+        )),
+        _SessionSpec('S2', _BUILD_S2, 60, 12.0, (
+            _warmup(15),
+            _ZoneSpec("Bloc allure semi", duration=10, scale_duration=True,
+                      pace=('semi_race', 'target'), pace_max=('semi_race', 'max'),
+                      hr_zone="87-92% FCmax", repetitions=3, recovery_minutes=2),
+            _cooldown(),
+        )),
+        _SessionSpec('S3', _BUILD_S3, 45, 7.5, (
+            _ZoneSpec("Endurance facile", duration=45, scale_duration=True,
+                      pace=('endurance', 'target'), hr_zone="75-80% FCmax"),
+        )),
+        _SessionSpec('S4', _BUILD_S4, ('long', 75, 3, 105), ('long_div', 5.8), (
+            _ZoneSpec("Endurance de base", duration=('long', -20),
+                      pace=('endurance', 'target'), hr_zone="75-80% FCmax"),
+            _ZoneSpec("Finish allure semi", duration=20, scale_duration=True,
+                      pace=('semi_race', 'target'), hr_zone="87-90% FCmax"),
+        ), title_pattern="Sortie longue progressive {d}min"),
+    ),
+    'taper': (
+        _SessionSpec('S1', _TAPER_S1, 50, 8.0, (
+            _warmup(15),
+            _ZoneSpec("300m VMA", distance_km=0.3, pace=('vma', 'target'),
+                      repetitions=6, scale_repetitions=True, recovery_minutes=1.5),
+            _cooldown(),
+        )),
+        _SessionSpec('S2', _TAPER_S2, 55, 10.0, (
+            _warmup(15),
+            _ZoneSpec("Allure semi", duration=8, scale_duration=True,
+                      pace=('semi_race', 'target'), repetitions=2, recovery_minutes=3),
+            _cooldown(),
+        )),
+        _SessionSpec('S3', _TAPER_S3, 45, 7.5, (
+            _ZoneSpec("Endurance", duration=45, scale_duration=True,
+                      pace=('endurance', 'target'), hr_zone="75-80% FCmax"),
+        )),
+        _SessionSpec('S4', _TAPER_S4, 65, 11.0, (
+            _ZoneSpec("Endurance confortable", duration=65, scale_duration=True,
+                      pace="6:00", hr_zone="75-82% FCmax"),
+        )),
+    ),
+    'race': (
+        _SessionSpec('S1', _RACE_WEEK_S1, 30, 5.0, (
+            _ZoneSpec("Endurance très légère", duration=30,
+                      pace=('recovery', 'max'), hr_zone="70-75% FCmax"),
+        )),
+        _SessionSpec('S2', _RACE_WEEK_S2, 35, 5.5, (
+            _warmup(15),
+            _ZoneSpec("200m rapide", distance_km=0.2, pace="3:20",
+                      repetitions=4, recovery_minutes=2),
+            _cooldown(),
+        )),
+        _SessionSpec('RACE', _RACE_DAY, 105, 21.1, (
+            _ZoneSpec("Km 1-5: Mise en route", distance_km=5.0,
+                      pace=('endurance', 'max'), hr_zone="82-87% FCmax"),
+            _ZoneSpec("Km 6-15: Rythme de croisière", distance_km=10.0,
+                      pace=('semi_race', 'target'), hr_zone="87-92% FCmax"),
+            _ZoneSpec("Km 16-21: Push final", distance_km=6.1,
+                      pace=('semi_race', 'max'), hr_zone="90-95% FCmax"),
+        ), day_of_week=7),  # Dimanche généralement
+    ),
+}
+
+
+# Noms de plan pour les objectifs usuels, indexés par (heures, minutes)
+_SUB_PLAN_NAMES = {
+    (1, 30): "Semi-Marathon Sub 1:30",
+    (1, 35): "Semi-Marathon Sub 1:35",
+    (1, 40): "Semi-Marathon Sub 1:40",
+    (1, 45): "Semi-Marathon Sub 1:45",
+    (1, 50): "Semi-Marathon Sub 1:50",
+    (2, 0): "Semi-Marathon Sub 2:00",
+}
+
+
+# Correspondance zones "étendues" → zones des allures par défaut (sans VMA)
+_ZONE_MAPPING = {
+    'semi_race': 'threshold',
+    '10k_race': 'threshold',
+    '5k_race': 'intervals',
+    'easy': 'endurance',
+    'recovery': 'recovery'
+}
 
 
 class SemiMarathonPlanGenerator:
@@ -22,7 +247,14 @@ class SemiMarathonPlanGenerator:
     - Capable de courir 10km en ~50min
     - 4 séances/semaine minimum
     """
-    
+
+    __slots__ = (
+        'athlete_id', 'start_date', 'race_date', 'sessions_per_week',
+        'preferred_days', 'athlete_profile', 'target_time_minutes',
+        'paces_raw', 'using_vma', 'hr_zones', 'duration_weeks',
+        '_pace_cache', '_phase_for_week', '_day_cycle', '_race_day_structure'
+    )
+
     def __init__(
         self,
         athlete_id: str,
@@ -40,18 +272,32 @@ class SemiMarathonPlanGenerator:
         self.preferred_days = preferred_days or [2, 4, 6, 7]  # Mar, Jeu, Sam, Dim
         self.athlete_profile = athlete_profile
         self.target_time_minutes = target_time_minutes  # Objectif choisi par l'utilisateur
-        
+
+        # Valider la durée avant tout calcul coûteux (fail-fast sur dates invalides)
+        delta = race_date - self.start_date
+        self.duration_weeks = delta.days // 7
+
+        if self.duration_weeks < 8:
+            raise ValueError("Le plan doit durer au moins 8 semaines")
+        if self.duration_weeks > 16:
+            print(f"⚠️ Attention: plan de {self.duration_weeks} semaines (recommandé: 12-14)")
+
         # Calculer l'allure cible en min/km si objectif fourni
         target_pace_min_per_km = None
         if target_time_minutes:
             target_pace_min_per_km = target_time_minutes / 21.1  # Semi-marathon
-        
+
+        # Lire les données cardiaques une seule fois (get_max_heart_rate est un
+        # appel de méthode, réutilisé pour les allures et les zones FC)
+        fc_max = athlete_profile.get_max_heart_rate() if athlete_profile else None
+        fc_repos = athlete_profile.resting_heart_rate if athlete_profile else None
+
         # Calculer les allures personnalisées si profil disponible
         if athlete_profile and athlete_profile.vma_kmh:
             self.paces_raw = calculate_training_paces_from_vma(
                 athlete_profile.vma_kmh,
-                fc_max=athlete_profile.max_heart_rate,
-                fc_repos=athlete_profile.resting_heart_rate,
+                fc_max=fc_max,
+                fc_repos=fc_repos,
                 level=athlete_profile.training_level,
                 target_pace_min_per_km=target_pace_min_per_km,
                 distance_km=21.1
@@ -59,42 +305,67 @@ class SemiMarathonPlanGenerator:
             self.using_vma = True
         elif target_time_minutes:
             # Calculer depuis l'objectif SANS VMA
-            from utils.pace_calculator import calculate_training_paces_from_target
             self.paces_raw = calculate_training_paces_from_target(target_time_minutes, 21.1)
             self.using_vma = True  # Même format de sortie
         else:
             # Utiliser les allures par défaut (VMA 17 km/h)
             self.paces_raw = SEMI_145_PACES
             self.using_vma = False
-        
+
+        # Pré-résoudre toutes les allures consommées par les générateurs de
+        # séances : get_pace devient une simple lecture de dict
+        self._pace_cache = {
+            (zone, pace_type): self._resolve_pace(zone, pace_type)
+            for zone in self._PACE_ZONES
+            for pace_type in self._PACE_TYPES
+        }
+
         # Calculer les zones FC personnalisées si profil disponible
         if athlete_profile:
-            fc_max = athlete_profile.get_max_heart_rate()
-            fc_repos = athlete_profile.resting_heart_rate
             self.hr_zones = calculate_heart_rate_zones(fc_max, fc_repos)
         else:
             self.hr_zones = None
-        
-        # Calculer le nombre de semaines
-        delta = race_date - self.start_date
-        self.duration_weeks = delta.days // 7
-        
-        if self.duration_weeks < 8:
-            raise ValueError("Le plan doit durer au moins 8 semaines")
-        if self.duration_weeks > 16:
-            print(f"⚠️ Attention: plan de {self.duration_weeks} semaines (recommandé: 12-14)")
+
+        # Phase de chaque semaine, indexée par week_num - 1
+        self._phase_for_week = self._build_phase_table()
+
+        # Structure du jour de course : entièrement déterminée par les allures
+        # de l'instance, construite une seule fois
+        self._race_day_structure = [
+            self._build_zone(z, 1.0, None)
+            for z in _SESSION_SPECS['race'][-1].structure
+        ]
+
+        # Jour attribué à chaque séance de la semaine, précalculé une fois
+        # (les générateurs produisent jusqu'à 4 séances quel que soit sessions_per_week)
+        self._day_cycle = [
+            self.preferred_days[i % len(self.preferred_days)]
+            for i in range(max(self.sessions_per_week, 4))
+        ]
     
+    # Zones et types d'allure utilisés par les générateurs de séances
+    _PACE_ZONES = ('endurance', 'tempo', 'threshold', 'vma', 'semi_race',
+                   '10k_race', '5k_race', 'easy', 'recovery', 'intervals')
+    _PACE_TYPES = ('min', 'max', 'target')
+
     def get_pace(self, zone: str, pace_type: str = 'target') -> str:
         """
         Récupère une allure selon la zone
-        
+
         Args:
             zone: Nom de la zone (endurance, tempo, threshold, vma, semi_race, etc.)
             pace_type: 'min', 'max' ou 'target' (uniquement si VMA utilisée)
-        
+
         Returns:
             Allure formatée "M:SS"
         """
+        cached = self._pace_cache.get((zone, pace_type))
+        if cached is not None:
+            return cached
+        return self._resolve_pace(zone, pace_type)
+
+    def _resolve_pace(self, zone: str, pace_type: str) -> str:
+        """Résout une allure depuis paces_raw (utilisé pour remplir le cache)"""
         if self.using_vma:
             # Avec VMA, on a des dictionnaires {min, max, target}
             if zone in self.paces_raw:
@@ -104,56 +375,47 @@ class SemiMarathonPlanGenerator:
         else:
             # Sans VMA, on a juste des strings
             # Mapper les noms de zones si nécessaire
-            zone_mapping = {
-                'semi_race': 'threshold',
-                '10k_race': 'threshold',
-                '5k_race': 'intervals',
-                'easy': 'endurance',
-                'recovery': 'recovery'
-            }
-            actual_zone = zone_mapping.get(zone, zone)
+            actual_zone = _ZONE_MAPPING.get(zone, zone)
             return self.paces_raw.get(actual_zone, self.paces_raw.get('endurance', '5:00'))
     
     def _get_monday(self, d: date) -> date:
         """Retourne le lundi de la semaine"""
-        while d.weekday() != 0:  # 0 = lundi
-            d -= timedelta(days=1)
-        return d
+        return d - timedelta(days=d.weekday())  # weekday() == 0 le lundi
     
+    @staticmethod
+    def _fmt_hms(total_minutes: int) -> str:
+        """Formate un total de minutes en "H:MM:00" """
+        hours, mins = divmod(total_minutes, 60)
+        return f"{hours}:{mins:02d}:00"
+
+    @staticmethod
+    def _fmt_pace(total_seconds: float) -> str:
+        """Formate un nombre de secondes par km en "M:SS" """
+        pace_min, pace_sec = divmod(int(total_seconds), 60)
+        return f"{pace_min}:{pace_sec:02d}"
+
+    @classmethod
+    def _format_goal(cls, total_minutes: int) -> tuple[str, str]:
+        """Formate le temps objectif ("H:MM:00") et l'allure cible ("M:SS") pour un semi"""
+        goal_time = cls._fmt_hms(total_minutes)
+        target_pace = cls._fmt_pace((total_minutes * 60) / 21.1)
+        return goal_time, target_pace
+
     def generate_plan(self) -> TrainingPlan:
         """Génère le plan complet"""
-        
+
         # Calculer l'objectif et l'allure cible
         # Priorité : 1) target_time_minutes (choix utilisateur), 2) VMA, 3) défaut
-        
+
         if self.target_time_minutes:
             # L'utilisateur a choisi un objectif spécifique
-            hours = self.target_time_minutes // 60
-            mins = self.target_time_minutes % 60
-            goal_time = f"{hours}:{mins:02d}:00"
-            
-            # Calculer allure cible (min/km)
-            target_pace_sec = (self.target_time_minutes * 60) / 21.1
-            target_pace_min = int(target_pace_sec // 60)
-            target_pace_sec_rem = int(target_pace_sec % 60)
-            target_pace = f"{target_pace_min}:{target_pace_sec_rem:02d}"
-            
+            goal_time, target_pace = self._format_goal(self.target_time_minutes)
+            hours, mins = divmod(self.target_time_minutes, 60)
+
             # Nom du plan basé sur l'objectif choisi
-            if hours == 1 and mins == 30:
-                plan_name = "Semi-Marathon Sub 1:30"
-            elif hours == 1 and mins == 35:
-                plan_name = "Semi-Marathon Sub 1:35"
-            elif hours == 1 and mins == 40:
-                plan_name = "Semi-Marathon Sub 1:40"
-            elif hours == 1 and mins == 45:
-                plan_name = "Semi-Marathon Sub 1:45"
-            elif hours == 1 and mins == 50:
-                plan_name = "Semi-Marathon Sub 1:50"
-            elif hours == 2:
-                plan_name = "Semi-Marathon Sub 2:00"
-            else:
-                plan_name = f"Semi-Marathon Sub {hours}:{mins:02d}"
-                
+            plan_name = _SUB_PLAN_NAMES.get((hours, mins), f"Semi-Marathon Sub {hours}:{mins:02d}")
+
+
             # Ajouter info VMA si disponible
             if self.athlete_profile and self.athlete_profile.vma_kmh:
                 est_minutes, est_time_str = estimate_race_time(21.1, self.athlete_profile.vma_kmh)
@@ -162,16 +424,9 @@ class SemiMarathonPlanGenerator:
         elif self.athlete_profile and self.athlete_profile.vma_kmh:
             # Pas d'objectif choisi, utiliser la VMA
             est_minutes, est_time_str = estimate_race_time(21.1, self.athlete_profile.vma_kmh)
-            hours = est_minutes // 60
-            mins = est_minutes % 60
-            goal_time = f"{hours}:{mins:02d}:00"
-            
-            # Calculer allure cible (min/km)
-            target_pace_sec = (est_minutes * 60) / 21.1
-            target_pace_min = int(target_pace_sec // 60)
-            target_pace_sec_rem = int(target_pace_sec % 60)
-            target_pace = f"{target_pace_min}:{target_pace_sec_rem:02d}"
-            
+            goal_time, target_pace = self._format_goal(est_minutes)
+            hours, mins = divmod(est_minutes, 60)
+
             # Nom du plan basé sur l'objectif VMA
             if hours == 1 and mins < 30:
                 plan_name = f"Semi-Marathon Sub 1:30 (objectif: {est_time_str})"
@@ -202,54 +457,37 @@ class SemiMarathonPlanGenerator:
             athlete_id=self.athlete_id
         )
         
-        # Définir les phases
-        phases = self._calculate_phases()
-        
-        # Générer les semaines
-        for week_num in range(1, self.duration_weeks + 1):
-            phase = self._get_phase_for_week(week_num, phases)
-            week = self._generate_week(week_num, phase)
-            plan.add_week(week)
-        
+        # Générer les semaines en un seul extend plutôt qu'un add_week par tour
+        plan.weeks.extend(
+            self._generate_week(week_num, self._phase_for_week[week_num - 1])
+            for week_num in range(1, self.duration_weeks + 1)
+        )
+
         return plan
-    
-    def _calculate_phases(self) -> dict:
-        """Calcule la répartition des phases"""
+
+    def _build_phase_table(self) -> list[TrainingPhase]:
+        """Construit la phase de chaque semaine (répartition base/build/taper)"""
         total = self.duration_weeks
-        
+
         if total <= 10:
             # Plan court
-            return {
-                'base': (1, 3),
-                'build': (4, 8),
-                'taper': (9, total)
-            }
+            base_end, build_end = 3, 8
         elif total <= 12:
             # Plan standard
-            return {
-                'base': (1, 4),
-                'build': (5, 10),
-                'taper': (11, total)
-            }
+            base_end, build_end = 4, 10
         else:
             # Plan long
             base_weeks = int(total * 0.3)
             build_weeks = int(total * 0.6)
-            return {
-                'base': (1, base_weeks),
-                'build': (base_weeks + 1, base_weeks + build_weeks),
-                'taper': (base_weeks + build_weeks + 1, total)
-            }
-    
-    def _get_phase_for_week(self, week_num: int, phases: dict) -> TrainingPhase:
-        """Détermine la phase d'une semaine"""
-        if phases['base'][0] <= week_num <= phases['base'][1]:
-            return TrainingPhase.BASE
-        elif phases['build'][0] <= week_num <= phases['build'][1]:
-            return TrainingPhase.BUILD
-        else:
-            return TrainingPhase.TAPER
-    
+            base_end, build_end = base_weeks, base_weeks + build_weeks
+
+        return [
+            TrainingPhase.BASE if week_num <= base_end
+            else TrainingPhase.BUILD if week_num <= build_end
+            else TrainingPhase.TAPER
+            for week_num in range(1, total + 1)
+        ]
+
     def _generate_week(self, week_number: int, phase: TrainingPhase) -> TrainingWeek:
         """Génère une semaine d'entraînement"""
         week_start = self.start_date + timedelta(weeks=week_number - 1)
@@ -271,350 +509,109 @@ class SemiMarathonPlanGenerator:
             week_type=week_type
         )
         
-        # Générer les séances selon la phase
+        # Générer les séances selon la phase (table de specs partagée)
         if phase == TrainingPhase.BASE:
-            sessions = self._generate_base_sessions(week_number, is_recovery_week)
+            sessions = self._generate_sessions(week_number, _SESSION_SPECS['base'],
+                                               0.75 if is_recovery_week else 1.0)
         elif phase == TrainingPhase.BUILD:
-            sessions = self._generate_build_sessions(week_number, is_recovery_week)
+            sessions = self._generate_sessions(week_number, _SESSION_SPECS['build'],
+                                               0.8 if is_recovery_week else 1.0)
         else:  # TAPER
-            sessions = self._generate_taper_sessions(week_number)
+            weeks_to_race = self.duration_weeks - week_number + 1
+            if weeks_to_race == 1:
+                # Semaine de course: volume très réduit
+                sessions = self._generate_sessions(week_number, _SESSION_SPECS['race'], 1.0)
+            else:
+                # 2-3 semaines avant: volume réduit, intensité maintenue
+                reduction = 0.7 if weeks_to_race == 2 else 0.85
+                sessions = self._generate_sessions(week_number, _SESSION_SPECS['taper'], reduction)
         
         # Assigner les jours et ajouter à la semaine
         for i, session in enumerate(sessions):
-            day = self.preferred_days[i % len(self.preferred_days)]
-            session.day_of_week = day
+            session.day_of_week = self._day_cycle[i]
             session.session_number = i + 1
             week.add_session(session)
         
         return week
     
-    def _generate_base_sessions(self, week_num: int, is_recovery: bool) -> list[TrainingSession]:
-        """Génère les séances de la phase de base"""
-        sessions = []
-        factor = 0.75 if is_recovery else 1.0
-        
-        # Séance 1: Endurance fondamentale
-        sessions.append(TrainingSession(
-            id=f"W{week_num}_S1",
-            week_number=week_num,
-            day_of_week=1,
-            session_number=1,
-            session_type=SessionType.ENDURANCE,
-            intensity=SessionIntensity.EASY,
-            title="Endurance fondamentale",
-            description="Course facile à allure conversationnelle",
-            duration_minutes=int(50 * factor),
-            distance_km=8.0 * factor,
-            structure=[
-                PaceZone(
-                    description="Endurance fondamentale",
-                    duration_minutes=int(50 * factor),
-                    pace_min_per_km=self.get_pace('endurance', 'target'),
-                    pace_max_per_km="6:15",
-                    hr_zone="75-80% FCmax"
-                )
-            ]
-        ))
-        
-        # Séance 2: Fartlek ou tempo léger
-        sessions.append(TrainingSession(
-            id=f"W{week_num}_S2",
-            week_number=week_num,
-            day_of_week=2,
-            session_number=2,
-            session_type=SessionType.FARTLEK,
-            intensity=SessionIntensity.MODERATE,
-            title="Fartlek léger",
-            description="Variations d'allure en nature",
-            duration_minutes=int(45 * factor),
-            distance_km=7.5 * factor,
-            structure=[
-                PaceZone(description="Échauffement", duration_minutes=10, pace_min_per_km=self.get_pace('easy', 'target')),
-                PaceZone(description="Fartlek (accélérations libres)", duration_minutes=int(25 * factor), 
-                        pace_min_per_km=self.get_pace('tempo', 'target'), hr_zone="80-87% FCmax"),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('recovery', 'max'))
-            ]
-        ))
-        
-        # Séance 3: Endurance courte
-        sessions.append(TrainingSession(
-            id=f"W{week_num}_S3",
-            week_number=week_num,
-            day_of_week=3,
-            session_number=3,
-            session_type=SessionType.ENDURANCE,
-            intensity=SessionIntensity.EASY,
-            title="Endurance moyenne",
-            description="Course facile de récupération",
-            duration_minutes=int(40 * factor),
-            distance_km=6.5 * factor,
-            structure=[
-                PaceZone(description="Endurance", duration_minutes=int(40 * factor),
-                        pace_min_per_km=self.get_pace('endurance', 'target'), hr_zone="75-80% FCmax")
-            ]
-        ))
-        
-        # Séance 4: Sortie longue
-        long_duration = min(60 + (week_num * 5), 90)  # Progression
-        sessions.append(TrainingSession(
-            id=f"W{week_num}_S4",
-            week_number=week_num,
-            day_of_week=4,
-            session_number=4,
-            session_type=SessionType.LONG_RUN,
-            intensity=SessionIntensity.MODERATE,
-            title=f"Sortie longue {int(long_duration * factor)}min",
-            description="Sortie longue à allure confortable",
-            duration_minutes=int(long_duration * factor),
-            distance_km=round((long_duration / 6) * factor, 1),  # ~6min/km
-            is_key_session=True,
-            structure=[
-                PaceZone(description="Endurance longue", duration_minutes=int(long_duration * factor),
-                        pace_min_per_km=self.get_pace('endurance', 'min'), pace_max_per_km=self.get_pace('endurance', 'max'), hr_zone="75-82% FCmax")
-            ]
-        ))
-        
-        return sessions
-    
-    def _generate_build_sessions(self, week_num: int, is_recovery: bool) -> list[TrainingSession]:
-        """Génère les séances de la phase de développement (intensif)"""
-        sessions = []
-        factor = 0.8 if is_recovery else 1.0
-        
-        # Séance 1: VMA ou intervalles
-        sessions.append(TrainingSession(
-            id=f"W{week_num}_S1",
-            week_number=week_num,
-            day_of_week=1,
-            session_number=1,
-            session_type=SessionType.INTERVALS,
-            intensity=SessionIntensity.VERY_HARD,
-            title="VMA courte",
-            description="Intervalles courts à VMA",
-            duration_minutes=int(55 * factor),
-            distance_km=9.0 * factor,
-            is_key_session=True,
-            structure=[
-                PaceZone(description="Échauffement", duration_minutes=15, pace_min_per_km=self.get_pace('easy', 'target')),
-                PaceZone(description="400m VMA", distance_km=0.4, pace_min_per_km=self.get_pace('vma', 'target'),
-                        hr_zone="95-100% FCmax", repetitions=int(8 * factor), recovery_minutes=1.5),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('recovery', 'max'))
-            ]
-        ))
-        
-        # Séance 2: Seuil / Allure semi
-        sessions.append(TrainingSession(
-            id=f"W{week_num}_S2",
-            week_number=week_num,
-            day_of_week=2,
-            session_number=2,
-            session_type=SessionType.THRESHOLD,
-            intensity=SessionIntensity.HARD,
-            title="Seuil / Allure semi",
-            description="Blocs à allure semi-marathon",
-            duration_minutes=int(60 * factor),
-            distance_km=12.0 * factor,
-            is_key_session=True,
-            structure=[
-                PaceZone(description="Échauffement", duration_minutes=15, pace_min_per_km=self.get_pace('easy', 'target')),
-                PaceZone(description="Bloc allure semi", duration_minutes=int(10 * factor),
-                        pace_min_per_km=self.get_pace('semi_race', 'target'), pace_max_per_km=self.get_pace('semi_race', 'max'),
-                        hr_zone="87-92% FCmax", repetitions=3, recovery_minutes=2),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('recovery', 'max'))
-            ]
-        ))
-        
-        # Séance 3: Endurance active
-        sessions.append(TrainingSession(
-            id=f"W{week_num}_S3",
-            week_number=week_num,
-            day_of_week=3,
-            session_number=3,
-            session_type=SessionType.ENDURANCE,
-            intensity=SessionIntensity.EASY,
-            title="Récupération active",
-            description="Endurance légère entre les séances intenses",
-            duration_minutes=int(45 * factor),
-            distance_km=7.5 * factor,
-            structure=[
-                PaceZone(description="Endurance facile", duration_minutes=int(45 * factor),
-                        pace_min_per_km=self.get_pace('endurance', 'target'), hr_zone="75-80% FCmax")
-            ]
-        ))
-        
-        # Séance 4: Sortie longue avec finish
-        long_duration = min(75 + (week_num * 3), 105)
-        sessions.append(TrainingSession(
-            id=f"W{week_num}_S4",
-            week_number=week_num,
-            day_of_week=4,
-            session_number=4,
-            session_type=SessionType.LONG_RUN,
-            intensity=SessionIntensity.MODERATE,
-            title=f"Sortie longue progressive {int(long_duration * factor)}min",
-            description="Sortie longue avec finish plus rapide",
-            duration_minutes=int(long_duration * factor),
-            distance_km=round((long_duration / 5.8) * factor, 1),
-            is_key_session=True,
-            structure=[
-                PaceZone(description="Endurance de base", duration_minutes=int((long_duration - 20) * factor),
-                        pace_min_per_km=self.get_pace('endurance', 'target'), hr_zone="75-80% FCmax"),
-                PaceZone(description="Finish allure semi", duration_minutes=int(20 * factor),
-                        pace_min_per_km=self.get_pace('semi_race', 'target'), hr_zone="87-90% FCmax")
-            ]
-        ))
-        
-        return sessions
-    
-    def _generate_taper_sessions(self, week_num: int) -> list[TrainingSession]:
-        """Génère les séances de la phase d'affûtage"""
-        sessions = []
-        weeks_to_race = self.duration_weeks - week_num + 1
-        
-        if weeks_to_race == 1:
-            # Semaine de course: volume très réduit
-            sessions.append(TrainingSession(
-                id=f"W{week_num}_S1",
-                week_number=week_num,
-                day_of_week=1,
-                session_number=1,
-                session_type=SessionType.ENDURANCE,
-                intensity=SessionIntensity.VERY_EASY,
-                title="Décrassage léger",
-                description="Course très facile pour rester actif",
-                duration_minutes=30,
-                distance_km=5.0,
-                structure=[
-                    PaceZone(description="Endurance très légère", duration_minutes=30,
-                            pace_min_per_km=self.get_pace('recovery', 'max'), hr_zone="70-75% FCmax")
-                ]
-            ))
-            
-            sessions.append(TrainingSession(
-                id=f"W{week_num}_S2",
-                week_number=week_num,
-                day_of_week=2,
-                session_number=2,
-                session_type=SessionType.INTERVALS,
-                intensity=SessionIntensity.MODERATE,
-                title="Rappel VMA court",
-                description="Quelques accélérations pour garder jambes vives",
-                duration_minutes=35,
-                distance_km=5.5,
-                structure=[
-                    PaceZone(description="Échauffement", duration_minutes=15, pace_min_per_km=self.get_pace('easy', 'target')),
-                    PaceZone(description="200m rapide", distance_km=0.2,
-                            pace_min_per_km="3:20", repetitions=4, recovery_minutes=2),
-                    PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('recovery', 'max'))
-                ]
-            ))
-            
-            # RACE DAY
-            sessions.append(TrainingSession(
-                id=f"W{week_num}_RACE",
-                week_number=week_num,
-                day_of_week=7,  # Dimanche généralement
-                session_number=3,
-                session_type=SessionType.RACE,
-                intensity=SessionIntensity.VERY_HARD,
-                title="🏁 SEMI-MARATHON - Objectif 1:45",
-                description="Course cible ! Objectif: 4:58/km de moyenne. Bonne chance ! 🚀",
-                duration_minutes=105,
-                distance_km=21.1,
-                is_key_session=True,
-                can_be_postponed=False,
-                can_be_replaced=False,
-                structure=[
-                    PaceZone(description="Km 1-5: Mise en route", distance_km=5.0,
-                            pace_min_per_km=self.get_pace('endurance', 'max'), hr_zone="82-87% FCmax"),
-                    PaceZone(description="Km 6-15: Rythme de croisière", distance_km=10.0,
-                            pace_min_per_km=self.get_pace('semi_race', 'target'), hr_zone="87-92% FCmax"),
-                    PaceZone(description="Km 16-21: Push final", distance_km=6.1,
-                            pace_min_per_km=self.get_pace('semi_race', 'max'), hr_zone="90-95% FCmax")
-                ]
-            ))
-            
+    def _generate_sessions(self, week_num: int, specs: tuple, factor: float) -> Iterator[TrainingSession]:
+        """
+        Produit les séances d'une semaine depuis une liste de _SessionSpec.
+
+        Le même interpréteur sert les quatre variantes (base, build, taper,
+        semaine de course) : seules les données changent. Générateur : les
+        séances sont consommées au fil de l'eau par _generate_week sans liste
+        intermédiaire.
+        """
+        build_zone = self._build_zone  # liaison locale : évite le dispatch d'attribut par zone
+        for spec in specs:
+            # Durée de la séance (la sortie longue progresse avec la semaine)
+            if isinstance(spec.duration, tuple):
+                base, step, cap = spec.duration[1:]
+                long_duration = min(base + week_num * step, cap)
+                duration = int(long_duration * factor)
+            else:
+                long_duration = None
+                duration = int(spec.duration * factor)
+
+            # Distance totale
+            if isinstance(spec.distance, tuple):
+                distance = round((long_duration / spec.distance[1]) * factor, 1)
+            else:
+                distance = spec.distance * factor
+
+            if spec.suffix == 'RACE':
+                structure = self._race_day_structure
+            else:
+                structure = [build_zone(z, factor, long_duration) for z in spec.structure]
+
+            update = {
+                'id': f"W{week_num}_{spec.suffix}",
+                'week_number': week_num,
+                'duration_minutes': duration,
+                'distance_km': distance,
+                'structure': structure,
+            }
+            if spec.title_pattern:
+                update['title'] = spec.title_pattern.format(d=duration)
+            if spec.day_of_week:
+                update['day_of_week'] = spec.day_of_week
+
+            yield spec.template.model_copy(update=update)
+
+    def _build_zone(self, z: '_ZoneSpec', factor: float, long_duration) -> PaceZone:
+        """Matérialise une portion de séance depuis sa description statique"""
+        # Durée : fixe, mise à l'échelle, ou relative à la sortie longue
+        if isinstance(z.duration, tuple):
+            duration = int((long_duration + z.duration[1]) * factor)
+        elif z.duration is not None and z.scale_duration:
+            duration = int(z.duration * factor)
         else:
-            # 2-3 semaines avant: volume réduit, intensité maintenue
-            reduction = 0.7 if weeks_to_race == 2 else 0.85
-            
-            sessions.append(TrainingSession(
-                id=f"W{week_num}_S1",
-                week_number=week_num,
-                day_of_week=1,
-                session_number=1,
-                session_type=SessionType.INTERVALS,
-                intensity=SessionIntensity.HARD,
-                title="VMA réduite",
-                description="Maintien qualité, volume réduit",
-                duration_minutes=int(50 * reduction),
-                distance_km=8.0 * reduction,
-                is_key_session=True,
-                structure=[
-                    PaceZone(description="Échauffement", duration_minutes=15, pace_min_per_km=self.get_pace('easy', 'target')),
-                    PaceZone(description="300m VMA", distance_km=0.3,
-                            pace_min_per_km=self.get_pace('vma', 'target'),
-                            repetitions=int(6 * reduction), recovery_minutes=1.5),
-                    PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('recovery', 'max'))
-                ]
-            ))
-            
-            sessions.append(TrainingSession(
-                id=f"W{week_num}_S2",
-                week_number=week_num,
-                day_of_week=2,
-                session_number=2,
-                session_type=SessionType.TEMPO,
-                intensity=SessionIntensity.MODERATE,
-                title="Allure spécifique",
-                description="Blocs courts à allure cible",
-                duration_minutes=int(55 * reduction),
-                distance_km=10.0 * reduction,
-                is_key_session=True,
-                structure=[
-                    PaceZone(description="Échauffement", duration_minutes=15, pace_min_per_km=self.get_pace('easy', 'target')),
-                    PaceZone(description="Allure semi", duration_minutes=int(8 * reduction),
-                            pace_min_per_km=self.get_pace('semi_race', 'target'),
-                            repetitions=2, recovery_minutes=3),
-                    PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('recovery', 'max'))
-                ]
-            ))
-            
-            sessions.append(TrainingSession(
-                id=f"W{week_num}_S3",
-                week_number=week_num,
-                day_of_week=3,
-                session_number=3,
-                session_type=SessionType.ENDURANCE,
-                intensity=SessionIntensity.EASY,
-                title="Endurance facile",
-                description="Récupération active",
-                duration_minutes=int(45 * reduction),
-                distance_km=7.5 * reduction,
-                structure=[
-                    PaceZone(description="Endurance", duration_minutes=int(45 * reduction),
-                            pace_min_per_km=self.get_pace('endurance', 'target'), hr_zone="75-80% FCmax")
-                ]
-            ))
-            
-            sessions.append(TrainingSession(
-                id=f"W{week_num}_S4",
-                week_number=week_num,
-                day_of_week=4,
-                session_number=4,
-                session_type=SessionType.LONG_RUN,
-                intensity=SessionIntensity.EASY,
-                title=f"Sortie longue allégée",
-                description="Sortie longue réduite pour affûtage",
-                duration_minutes=int(65 * reduction),
-                distance_km=11.0 * reduction,
-                structure=[
-                    PaceZone(description="Endurance confortable", duration_minutes=int(65 * reduction),
-                            pace_min_per_km="6:00", hr_zone="75-82% FCmax")
-                ]
-            ))
-        
-        return sessions
+            duration = z.duration
+
+        # Allures : clé (zone, type) résolue via get_pace, ou littéral "M:SS"
+        get_pace = self.get_pace
+        pace = get_pace(*z.pace) if isinstance(z.pace, tuple) else z.pace
+        pace_max = get_pace(*z.pace_max) if isinstance(z.pace_max, tuple) else z.pace_max
+
+        reps = int(z.repetitions * factor) if z.scale_repetitions else z.repetitions
+
+        return PaceZone(
+            description=z.description,
+            duration_minutes=duration,
+            distance_km=z.distance_km,
+            pace_min_per_km=pace,
+            pace_max_per_km=pace_max,
+            hr_zone=z.hr_zone,
+            repetitions=reps,
+            recovery_minutes=z.recovery_minutes
+        )
+
+
+# Cache des plans générés : mêmes entrées → plan identique, inutile de
+# reconstruire des centaines d'objets à chaque rafraîchissement
+_PLAN_CACHE: dict[tuple, TrainingPlan] = {}
+_PLAN_CACHE_MAX = 256
 
 
 # Fonction utilitaire
@@ -642,6 +639,29 @@ def generate_semi_145_plan(
     Returns:
         TrainingPlan complet
     """
+    # Clé hashable : le profil est résumé aux champs qui influencent le plan
+    profile_key = None
+    if athlete_profile:
+        profile_key = (
+            athlete_profile.vma_kmh,
+            athlete_profile.max_heart_rate,
+            athlete_profile.resting_heart_rate,
+            athlete_profile.training_level
+        )
+    cache_key = (
+        athlete_id,
+        start_date.isoformat(),
+        race_date.isoformat(),
+        sessions_per_week,
+        tuple(preferred_days) if preferred_days else None,
+        profile_key,
+        target_time_minutes
+    )
+
+    plan = _PLAN_CACHE.get(cache_key)
+    if plan is not None:
+        return plan
+
     generator = SemiMarathonPlanGenerator(
         athlete_id=athlete_id,
         start_date=start_date,
@@ -651,4 +671,9 @@ def generate_semi_145_plan(
         athlete_profile=athlete_profile,
         target_time_minutes=target_time_minutes
     )
-    return generator.generate_plan()
+    plan = generator.generate_plan()
+
+    if len(_PLAN_CACHE) >= _PLAN_CACHE_MAX:
+        _PLAN_CACHE.clear()
+    _PLAN_CACHE[cache_key] = plan
+    return plan
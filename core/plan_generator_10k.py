@@ -8,7 +8,56 @@ from models import (
 )
 from models.athlete_profile import AthleteProfile
 from utils.pace_calculator import calculate_training_paces_from_vma, estimate_race_time
-from typing import Optional
+from typing import Iterator, Optional
+
+# Mapping des zones pour compatibilité VMA (construit une seule fois au module)
+_ZONE_MAPPING = {
+    'race': '10k_race',  # Pour 10km, race = 10k_race (92-95% VMA)
+    # 'easy' reste 'easy' (70-75% VMA) - PAS endurance !
+    # 'interval' correspond à 10k_race pour les fractions
+}
+
+
+# Décalages (sec/km) appliqués à l'allure cible 10 km par la génération en lot,
+# alignés sur calculate_training_paces_from_target : (zone, (min, max, target))
+_BULK_ZONE_DELTAS = (
+    ('recovery', (90, 120, 105)),
+    ('easy', (60, 90, 75)),
+    ('endurance', (30, 45, 37)),
+    ('tempo', (15, 20, 17)),
+    ('threshold', (5, 10, 7)),
+    ('semi_race', (0, 0, 0)),
+    ('10k_race', (0, 0, 0)),
+    ('5k_race', (0, 0, 0)),
+    ('vma', (-13, -3, -8)),  # interval_delta = -8 pour 10 km
+)
+
+
+# Allure de repli quand une zone est inconnue
+_DEFAULT_PACE = '5:00'
+
+# Alias module des membres d'énumération référencés à chaud : une résolution
+# d'attribut en moins par référence dans les builders de séances
+_ENDURANCE = SessionType.ENDURANCE
+_TEMPO = SessionType.TEMPO
+_THRESHOLD = SessionType.THRESHOLD
+_INTERVALS = SessionType.INTERVALS
+_LONG_RUN = SessionType.LONG_RUN
+_EASY = SessionIntensity.EASY
+_MODERATE = SessionIntensity.MODERATE
+_HARD = SessionIntensity.HARD
+_PHASE_BASE = TrainingPhase.BASE
+_PHASE_BUILD = TrainingPhase.BUILD
+_PHASE_PEAK = TrainingPhase.PEAK
+_PHASE_TAPER = TrainingPhase.TAPER
+_WEEK_NORMAL = WeekType.NORMAL
+_WEEK_PEAK = WeekType.PEAK
+
+
+def _sec_to_pace(sec: int) -> str:
+    """Formate une allure en secondes/km au format "M:SS" """
+    minutes, seconds = divmod(int(sec), 60)
+    return f"{minutes}:{seconds:02d}"
 
 
 class Plan10kmGenerator:
@@ -21,7 +70,17 @@ class Plan10kmGenerator:
     - Sub 45min (4:30/km) - VMA ~15 km/h
     - Sub 50min (5:00/km) - VMA ~13.5 km/h
     """
-    
+
+    __slots__ = (
+        'athlete_id', 'start_date', 'race_date', 'target_time_minutes',
+        'sessions_per_week', 'preferred_days', 'athlete_profile',
+        'duration_weeks', 'target_pace_str', 'paces_raw', 'using_vma',
+        '_pace_strings', '_pace_floats', '_pace_min_max', '_phase_by_week',
+        '_start_ord', '_week_bounds', '_day_offsets', '_easy_templates',
+        '_sharpening_template', '_warmup_15', '_warmup_20', '_cooldown_10',
+        '_easy_distance', '_phase_builders'
+    )
+
     def __init__(
         self,
         athlete_id: str,
@@ -30,7 +89,8 @@ class Plan10kmGenerator:
         target_time_minutes: int = 40,
         sessions_per_week: int = 4,
         preferred_days: list[int] = None,
-        athlete_profile: Optional[AthleteProfile] = None
+        athlete_profile: Optional[AthleteProfile] = None,
+        precomputed_paces: Optional[dict] = None
     ):
         self.athlete_id = athlete_id
         self.start_date = start_date
@@ -42,14 +102,23 @@ class Plan10kmGenerator:
         
         # Calculer durée
         self.duration_weeks = (race_date - start_date).days // 7
-        
+
+        # Allure cible "M:SS" depuis l'objectif de temps (pas VMA), calculée une fois
+        target_pace_sec = target_time_minutes * 6  # secondes/km sur 10km
+        pace_min, pace_sec = divmod(target_pace_sec, 60)
+        self.target_pace_str = f"{pace_min}:{pace_sec:02d}"
+
         # Calculer l'allure cible en min/km si objectif fourni
         target_pace_min_per_km = None
         if target_time_minutes:
             target_pace_min_per_km = target_time_minutes / 10  # 10km
         
         # Allures selon objectif (ou VMA si profil disponible)
-        if athlete_profile and athlete_profile.vma_kmh:
+        if precomputed_paces is not None:
+            # Allures déjà résolues en amont (génération en lot vectorisée)
+            self.paces_raw = precomputed_paces
+            self.using_vma = True  # Même format de sortie
+        elif athlete_profile and athlete_profile.vma_kmh:
             # Utiliser VMA pour calculer toutes les allures
             self.paces_raw = calculate_training_paces_from_vma(
                 athlete_profile.vma_kmh,
@@ -69,86 +138,152 @@ class Plan10kmGenerator:
             # Ni VMA ni objectif : utiliser valeurs par défaut
             self.paces_raw = self._calculate_paces()
             self.using_vma = False
-    
+
+        # Résoudre chaque allure une seule fois (string + float) pour éviter
+        # de re-parser "M:SS" à chaque création de séance
+        self._resolve_all_paces()
+
+        # Phase de chaque semaine pré-calculée une fois (tuple immuable)
+        self._phase_by_week = self._build_phase_table()
+
+        # Bornes de chaque semaine et décalages des jours préférés, calculés une
+        # fois en arithmétique d'ordinaux (pas d'objets timedelta dans la boucle)
+        self._start_ord = start_date.toordinal()
+        self._week_bounds = [
+            (date.fromordinal(self._start_ord + 7 * i),
+             date.fromordinal(self._start_ord + 7 * i + 6))
+            for i in range(self.duration_weeks)
+        ]
+        self._day_offsets = [d - 1 for d in self.preferred_days]
+
+        # Distances des footings : fonction pure de (durée, allure easy), avec
+        # une allure fixe par plan il n'y a que cinq valeurs possibles
+        self._easy_distance = {
+            d: round(d / self._pace_floats['easy'], 1) for d in (20, 25, 30, 35, 40)
+        }
+
+        # Prototypes de séances fixes (footings, affûtage), clonés semaine par
+        # semaine via model_copy au lieu d'être revalidés de zéro
+        self._easy_templates = {}
+        self._sharpening_template = None
+
+        # Prototypes des portions répétées dans toutes les séances de qualité ;
+        # clonés via model_copy dans les builders (pas de revalidation pydantic)
+        easy_pace = self._pace_strings['easy']
+        self._warmup_15 = PaceZone(description="Échauffement", duration_minutes=15,
+                                   pace_min_per_km=easy_pace)
+        self._warmup_20 = PaceZone(description="Échauffement", duration_minutes=20,
+                                   pace_min_per_km=easy_pace)
+        self._cooldown_10 = PaceZone(description="Retour au calme", duration_minutes=10,
+                                     pace_min_per_km=easy_pace)
+
+        # Table de dispatch phase -> builders de séances (remplace le if/elif)
+        self._phase_builders = {
+            _PHASE_BASE: self._build_base_week,
+            _PHASE_BUILD: self._build_build_week,
+            _PHASE_PEAK: self._build_peak_week,
+            _PHASE_TAPER: self._build_taper_week,
+        }
+
+    def _build_phase_table(self) -> tuple:
+        """Construit le tuple des phases semaine par semaine"""
+        phases = self._calculate_phases()
+        seq = (
+            [_PHASE_BASE] * phases['base']
+            + [_PHASE_BUILD] * phases['build']
+            + [_PHASE_PEAK] * phases['peak']
+            + [_PHASE_TAPER] * phases['taper']
+        )
+        # Compléter en TAPER si la répartition ne couvre pas toutes les semaines
+        if len(seq) < self.duration_weeks:
+            seq += [_PHASE_TAPER] * (self.duration_weeks - len(seq))
+        return tuple(seq)
+
+    def _resolve_all_paces(self):
+        """Pré-calcule les allures en string "M:SS" et en float (min/km) pour chaque zone"""
+        self._pace_strings = {}
+        self._pace_floats = {}
+        self._pace_min_max = {}
+        for zone in ('easy', 'tempo', 'threshold', 'interval', 'race'):
+            pace = self._resolve_pace(zone)
+            minutes, seconds = pace.split(':')
+            self._pace_strings[zone] = pace
+            self._pace_floats[zone] = int(minutes) + int(seconds) / 60.0
+            self._pace_min_max[zone] = (
+                self._resolve_pace(zone, 'min'),
+                self._resolve_pace(zone, 'max')
+            )
+
     def get_pace(self, zone: str, pace_type: str = 'target') -> str:
         """
-        Récupère une allure depuis le dictionnaire de paces.
-        Gère à la fois le format VMA (dict avec min/max/target) et le format simple (string).
-        
+        Récupère une allure depuis les tables pré-calculées (aucune résolution à chaud).
+
         Args:
             zone: Zone d'allure ('easy', 'tempo', 'threshold', 'interval', 'race')
             pace_type: Type d'allure ('min', 'max', 'target')
-        
+
         Returns:
             String au format "M:SS"
         """
-        # Mapping des zones pour compatibilité VMA
-        zone_mapping = {
-            'race': '10k_race',  # Pour 10km, race = 10k_race (92-95% VMA)
-            # 'easy' reste 'easy' (70-75% VMA) - PAS endurance !
-            # 'interval' correspond à 10k_race pour les fractions
-        }
-        
-        # Appliquer le mapping si nécessaire
-        actual_zone = zone_mapping.get(zone, zone)
+        if pace_type == 'target':
+            return self._pace_strings.get(zone, _DEFAULT_PACE)
+        if zone in self._pace_min_max:
+            return self._pace_min_max[zone][0 if pace_type == 'min' else 1]
+        return self._resolve_pace(zone, pace_type)
+
+    def _resolve_pace(self, zone: str, pace_type: str = 'target') -> str:
+        """
+        Résout une allure depuis le dictionnaire de paces.
+        Gère à la fois le format VMA (dict avec min/max/target) et le format simple (string).
+        """
+        # Appliquer le mapping de compatibilité VMA si nécessaire
+        actual_zone = _ZONE_MAPPING.get(zone, zone)
         
         if self.using_vma:
             # Format VMA: {'zone': {'min': 'M:SS', 'max': 'M:SS', 'target': 'M:SS'}}
-            if actual_zone in self.paces_raw:
-                zone_data = self.paces_raw[actual_zone]
+            zone_data = self.paces_raw.get(actual_zone)
+            if zone_data is not None:
                 if isinstance(zone_data, dict):
-                    return zone_data.get(pace_type, zone_data.get('target', '5:00'))
+                    value = zone_data.get(pace_type)
+                    return value if value is not None else zone_data.get('target', _DEFAULT_PACE)
                 return zone_data
-            # Fallback pour zones non trouvées
+            # Fallback pour zones non trouvées (sans allocation de dict vide)
             if zone == 'interval':
                 # Intervalles = légèrement plus rapide que 10k race
-                return self.paces_raw.get('10k_race', {}).get('max', '4:00')
-            return self.paces_raw.get('easy', {}).get('target', '5:00')
+                race_data = self.paces_raw.get('10k_race')
+                if isinstance(race_data, dict):
+                    return race_data.get('max', '4:00')
+                return '4:00'
+            easy_data = self.paces_raw.get('easy')
+            if isinstance(easy_data, dict):
+                return easy_data.get('target', _DEFAULT_PACE)
+            return _DEFAULT_PACE
         else:
             # Format simple: {'zone': 'M:SS'}
-            return self.paces_raw.get(zone, '5:00')
+            return self.paces_raw.get(zone, _DEFAULT_PACE)
     
     def _calculate_paces(self) -> dict:
         """Calcule les allures d'entraînement selon l'objectif"""
-        target_pace_sec = (self.target_time_minutes * 60) / 10  # secondes/km
-        target_pace_min = int(target_pace_sec // 60)
-        target_pace_sec_rem = int(target_pace_sec % 60)
-        target_pace = f"{target_pace_min}:{target_pace_sec_rem:02d}"
-        
-        # Zones d'entraînement (en sec/km)
-        easy_pace_sec = target_pace_sec + 60  # +1min/km
-        tempo_pace_sec = target_pace_sec + 20  # +20sec/km
-        threshold_pace_sec = target_pace_sec + 10  # +10sec/km
-        interval_pace_sec = target_pace_sec - 5  # -5sec/km (plus rapide)
-        
-        def sec_to_pace(sec):
-            m = int(sec // 60)
-            s = int(sec % 60)
-            return f"{m}:{s:02d}"
-        
+        target_pace_sec = self.target_time_minutes * 6  # secondes/km sur 10km
+
+        # Zones d'entraînement (décalages en sec/km par rapport à l'allure cible)
         return {
-            'easy': sec_to_pace(easy_pace_sec),
-            'tempo': sec_to_pace(tempo_pace_sec),
-            'threshold': sec_to_pace(threshold_pace_sec),
-            'interval': sec_to_pace(interval_pace_sec),
-            'race': target_pace
+            'easy': _sec_to_pace(target_pace_sec + 60),       # +1min/km
+            'tempo': _sec_to_pace(target_pace_sec + 20),      # +20sec/km
+            'threshold': _sec_to_pace(target_pace_sec + 10),  # +10sec/km
+            'interval': _sec_to_pace(target_pace_sec - 5),    # -5sec/km (plus rapide)
+            'race': self.target_pace_str
         }
     
     def generate_plan(self) -> TrainingPlan:
         """Génère le plan complet"""
-        # Calculer l'allure cible depuis l'objectif de temps (pas VMA)
-        target_pace_sec = (self.target_time_minutes * 60) / 10  # secondes/km
-        target_pace_min = int(target_pace_sec // 60)
-        target_pace_sec_rem = int(target_pace_sec % 60)
-        target_pace = f"{target_pace_min}:{target_pace_sec_rem:02d}"
-        
         plan = TrainingPlan(
             id=f"10k_{self.target_time_minutes}min_{self.athlete_id}_{self.start_date.isoformat()}",
             name=f"10km Sub {self.target_time_minutes}min",
             description=f"Plan structuré pour courir 10km en moins de {self.target_time_minutes} minutes",
             goal_distance="10km",
             goal_time=f"{self.target_time_minutes}:00",
-            target_pace_per_km=target_pace,  # Utiliser l'objectif réel, pas VMA
+            target_pace_per_km=self.target_pace_str,  # Utiliser l'objectif réel, pas VMA
             start_date=self.start_date,
             end_date=self.race_date,
             duration_weeks=self.duration_weeks,
@@ -157,16 +292,22 @@ class Plan10kmGenerator:
             athlete_id=self.athlete_id
         )
         
-        # Définir les phases
-        phases = self._calculate_phases()
-        
-        # Générer les semaines
-        for week_num in range(1, self.duration_weeks + 1):
-            phase = self._get_phase_for_week(week_num, phases)
-            week = self._generate_week(week_num, phase)
+        # Générer les semaines (paresseusement via iter_weeks)
+        for week in self.iter_weeks():
             plan.add_week(week)
-        
+
         return plan
+
+    def iter_weeks(self) -> Iterator[TrainingWeek]:
+        """
+        Génère les semaines une à une, sans matérialiser tout le plan.
+
+        Utile pour les consommateurs qui n'affichent que la prochaine
+        semaine : la latence de la première semaine ne dépend plus de la
+        durée totale du plan.
+        """
+        for week_num in range(1, self.duration_weeks + 1):
+            yield self._generate_week(week_num, self._phase_by_week[week_num - 1])
     
     def _calculate_phases(self) -> dict:
         """Calcule la répartition des phases pour 10km"""
@@ -194,37 +335,30 @@ class Plan10kmGenerator:
                 'taper': 1
             }
     
-    def _get_phase_for_week(self, week_num: int, phases: dict) -> TrainingPhase:
-        """Détermine la phase pour une semaine donnée"""
-        if week_num <= phases['base']:
-            return TrainingPhase.BASE
-        elif week_num <= phases['base'] + phases['build']:
-            return TrainingPhase.BUILD
-        elif week_num <= phases['base'] + phases['build'] + phases['peak']:
-            return TrainingPhase.PEAK
-        else:
-            return TrainingPhase.TAPER
+    def _get_phase_for_week(self, week_num: int) -> TrainingPhase:
+        """Détermine la phase pour une semaine donnée (lecture du tuple pré-calculé)"""
+        return self._phase_by_week[week_num - 1]
     
     def _generate_week(self, week_num: int, phase: TrainingPhase) -> TrainingWeek:
         """Génère une semaine d'entraînement"""
-        week_start = self.start_date + timedelta(weeks=week_num - 1)
-        week_end = week_start + timedelta(days=6)
-        
+        week_start, week_end = self._week_bounds[week_num - 1]
+
         week = TrainingWeek(
             week_number=week_num,
             start_date=week_start,
             end_date=week_end,
             phase=phase,
-            week_type=WeekType.PEAK if phase == TrainingPhase.PEAK else WeekType.NORMAL
+            week_type=_WEEK_PEAK if phase == _PHASE_PEAK else _WEEK_NORMAL
         )
         
         # Générer séances selon la phase
         sessions = self._create_sessions_for_phase(week_num, phase)
         
+        week_ord = self._start_ord + 7 * (week_num - 1)
         for i, session in enumerate(sessions, 1):
             if i <= len(self.preferred_days):
                 session.day_of_week = self.preferred_days[i - 1]
-                session.scheduled_date = week_start + timedelta(days=session.day_of_week - 1)
+                session.scheduled_date = date.fromordinal(week_ord + self._day_offsets[i - 1])
                 session.week_number = week_num
                 session.session_number = i
                 week.sessions.append(session)
@@ -232,64 +366,84 @@ class Plan10kmGenerator:
         return week
     
     def _create_sessions_for_phase(self, week_num: int, phase: TrainingPhase) -> list[TrainingSession]:
-        """Crée les séances selon la phase"""
-        sessions = []
-        
-        if phase == TrainingPhase.BASE:
-            # Phase de base : volume et endurance
-            sessions.append(self._create_easy_run(40, "Footing facile"))
-            sessions.append(self._create_tempo_session(week_num))
-            sessions.append(self._create_easy_run(35, "Récupération"))
-            if self.sessions_per_week >= 4:
-                sessions.append(self._create_long_run(week_num))
-        
-        elif phase == TrainingPhase.BUILD:
-            # Phase de développement : intervalles + seuil
-            sessions.append(self._create_easy_run(40, "Footing facile"))
-            sessions.append(self._create_interval_session(week_num))
-            sessions.append(self._create_easy_run(35, "Récupération"))
-            if self.sessions_per_week >= 4:
-                sessions.append(self._create_threshold_session(week_num))
-            if self.sessions_per_week >= 5:
-                sessions.append(self._create_long_run(week_num))
-        
-        elif phase == TrainingPhase.PEAK:
-            # Phase pic : spécifique 10km
-            sessions.append(self._create_easy_run(35, "Footing léger"))
-            sessions.append(self._create_race_pace_session(week_num))
-            sessions.append(self._create_easy_run(30, "Récupération"))
-            if self.sessions_per_week >= 4:
-                sessions.append(self._create_interval_session(week_num, short=True))
-        
-        else:  # TAPER
-            # Affûtage
-            sessions.append(self._create_easy_run(25, "Footing très léger"))
-            sessions.append(self._create_sharpening_session())
-            sessions.append(self._create_easy_run(20, "Activation pré-course"))
-        
-        return sessions[:self.sessions_per_week]
+        """Crée les séances selon la phase (dispatch par table, arrêt au quota hebdo)"""
+        # Ne construire que les séances réellement conservées : chaque builder
+        # alloue un arbre TrainingSession/PaceZone complet, inutile au-delà
+        # du quota hebdomadaire
+        builders = self._phase_builders[phase](week_num)
+        return [build() for build in builders[:self.sessions_per_week]]
+
+    def _build_base_week(self, week_num: int) -> tuple:
+        """Phase de base : volume et endurance"""
+        return (
+            lambda: self._create_easy_run(40, "Footing facile"),
+            lambda: self._create_tempo_session(week_num),
+            lambda: self._create_easy_run(35, "Récupération"),
+            lambda: self._create_long_run(week_num),
+        )
+
+    def _build_build_week(self, week_num: int) -> tuple:
+        """Phase de développement : intervalles + seuil"""
+        return (
+            lambda: self._create_easy_run(40, "Footing facile"),
+            lambda: self._create_interval_session(week_num),
+            lambda: self._create_easy_run(35, "Récupération"),
+            lambda: self._create_threshold_session(week_num),
+            lambda: self._create_long_run(week_num),
+        )
+
+    def _build_peak_week(self, week_num: int) -> tuple:
+        """Phase pic : spécifique 10km"""
+        return (
+            lambda: self._create_easy_run(35, "Footing léger"),
+            lambda: self._create_race_pace_session(week_num),
+            lambda: self._create_easy_run(30, "Récupération"),
+            lambda: self._create_interval_session(week_num, short=True),
+        )
+
+    def _build_taper_week(self, week_num: int) -> tuple:
+        """Affûtage"""
+        return (
+            lambda: self._create_easy_run(25, "Footing très léger"),
+            lambda: self._create_sharpening_session(),
+            lambda: self._create_easy_run(20, "Activation pré-course"),
+        )
     
+    @staticmethod
+    def _clone_template(template: TrainingSession) -> TrainingSession:
+        """Clone un prototype sans revalidation ; les zones sont copiées car
+        elles peuvent être modifiées en place en aval (adapt_session)"""
+        return template.model_copy(
+            update={'structure': [zone.model_copy() for zone in template.structure]}
+        )
+
     def _create_easy_run(self, duration: int, title: str) -> TrainingSession:
-        """Crée un footing facile"""
-        # Calculer la distance correctement depuis l'allure
-        pace_str = self.get_pace('easy')
-        pace_parts = pace_str.split(':')
-        pace_min_per_km = int(pace_parts[0]) + int(pace_parts[1]) / 60.0
-        distance = round(duration / pace_min_per_km, 1)
-        
+        """Crée un footing facile (prototype mémorisé puis cloné)"""
+        template = self._easy_templates.get((duration, title))
+        if template is None:
+            template = self._easy_templates[(duration, title)] = self._build_easy_run(duration, title)
+        return self._clone_template(template)
+
+    def _build_easy_run(self, duration: int, title: str) -> TrainingSession:
+        """Construit le prototype d'un footing facile"""
+        # Distance depuis la table pré-calculée (durées standard), sinon calculée
+        distance = self._easy_distance.get(duration)
+        if distance is None:
+            distance = round(duration / self._pace_floats['easy'], 1)
+
         return TrainingSession(
             id=f"easy_{duration}min",
             title=title,
             description=f"Course facile de {duration} minutes à allure confortable",
-            session_type=SessionType.ENDURANCE,
-            intensity=SessionIntensity.EASY,
+            session_type=_ENDURANCE,
+            intensity=_EASY,
             duration_minutes=duration,
             distance_km=distance,
             structure=[
                 PaceZone(
                     description="Footing facile",
                     duration_minutes=duration,
-                    pace_min_per_km=self.get_pace('easy'),
+                    pace_min_per_km=self._pace_strings['easy'],
                     hr_zone="65-75% FCmax"
                 )
             ],
@@ -302,26 +456,23 @@ class Plan10kmGenerator:
         """Crée une sortie longue"""
         duration = 50 + (week_num - 1) * 5  # Progression
         duration = min(duration, 90)  # Max 90min
-        
-        # Calculer la distance correctement depuis l'allure
-        pace_str = self.get_pace('easy')
-        pace_parts = pace_str.split(':')
-        pace_min_per_km = int(pace_parts[0]) + int(pace_parts[1]) / 60.0
-        distance = round(duration / pace_min_per_km, 1)
+
+        # Distance directement depuis l'allure pré-calculée (float min/km)
+        distance = round(duration / self._pace_floats['easy'], 1)
         
         return TrainingSession(
             id=f"long_{week_num}",
             title=f"Sortie longue {duration}min",
             description=f"Sortie longue en endurance fondamentale",
-            session_type=SessionType.LONG_RUN,
-            intensity=SessionIntensity.EASY,
+            session_type=_LONG_RUN,
+            intensity=_EASY,
             duration_minutes=duration,
             distance_km=distance,
             structure=[
                 PaceZone(
                     description="Endurance",
                     duration_minutes=duration,
-                    pace_min_per_km=self.get_pace('easy'),
+                    pace_min_per_km=self._pace_strings['easy'],
                     hr_zone="70-75% FCmax"
                 )
             ],
@@ -340,14 +491,14 @@ class Plan10kmGenerator:
             id=f"tempo_{week_num}",
             title=f"Tempo {duration}min",
             description=f"Allure soutenue pendant {duration} minutes",
-            session_type=SessionType.TEMPO,
-            intensity=SessionIntensity.MODERATE,
+            session_type=_TEMPO,
+            intensity=_MODERATE,
             duration_minutes=55,
             distance_km=9.0,
             structure=[
-                PaceZone(description="Échauffement", duration_minutes=15, pace_min_per_km=self.get_pace('easy')),
-                PaceZone(description="Tempo", duration_minutes=duration, pace_min_per_km=self.get_pace('tempo'), hr_zone="80-85% FCmax"),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('easy'))
+                self._warmup_15.model_copy(),
+                PaceZone(description="Tempo", duration_minutes=duration, pace_min_per_km=self._pace_strings['tempo'], hr_zone="80-85% FCmax"),
+                self._cooldown_10.model_copy()
             ],
             is_key_session=True,
             week_number=1,
@@ -374,21 +525,21 @@ class Plan10kmGenerator:
             id=f"intervals_{week_num}",
             title=title,
             description=f"{reps} répétitions à allure intervalle",
-            session_type=SessionType.INTERVALS,
-            intensity=SessionIntensity.HARD,
+            session_type=_INTERVALS,
+            intensity=_HARD,
             duration_minutes=60,
             distance_km=10.0,
             structure=[
-                PaceZone(description="Échauffement", duration_minutes=20, pace_min_per_km=self.get_pace('easy')),
+                self._warmup_20.model_copy(),
                 PaceZone(
                     description=f"Intervalle {duration}min",
                     duration_minutes=duration,
-                    pace_min_per_km=self.get_pace('interval'),
+                    pace_min_per_km=self._pace_strings['interval'],
                     hr_zone="90-95% FCmax",
                     repetitions=reps,
                     recovery_minutes=recovery
                 ),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('easy'))
+                self._cooldown_10.model_copy()
             ],
             is_key_session=True,
             week_number=1,
@@ -405,21 +556,21 @@ class Plan10kmGenerator:
             id=f"threshold_{week_num}",
             title=f"{reps}x{duration}min au seuil",
             description=f"{reps} fractions de {duration}min à allure seuil",
-            session_type=SessionType.THRESHOLD,
-            intensity=SessionIntensity.HARD,
+            session_type=_THRESHOLD,
+            intensity=_HARD,
             duration_minutes=60,
             distance_km=10.5,
             structure=[
-                PaceZone(description="Échauffement", duration_minutes=20, pace_min_per_km=self.get_pace('easy')),
+                self._warmup_20.model_copy(),
                 PaceZone(
                     description=f"Seuil {duration}min",
                     duration_minutes=duration,
-                    pace_min_per_km=self.get_pace('threshold'),
+                    pace_min_per_km=self._pace_strings['threshold'],
                     hr_zone="85-90% FCmax",
                     repetitions=reps,
                     recovery_minutes=3
                 ),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('easy'))
+                self._cooldown_10.model_copy()
             ],
             is_key_session=True,
             week_number=1,
@@ -433,14 +584,14 @@ class Plan10kmGenerator:
             id=f"race_pace_{week_num}",
             title="6km allure course",
             description="6km à l'allure cible de la course",
-            session_type=SessionType.TEMPO,
-            intensity=SessionIntensity.HARD,
+            session_type=_TEMPO,
+            intensity=_HARD,
             duration_minutes=55,
             distance_km=10.0,
             structure=[
-                PaceZone(description="Échauffement", duration_minutes=20, pace_min_per_km=self.get_pace('easy')),
-                PaceZone(description="6km allure course", distance_km=6.0, pace_min_per_km=self.get_pace('race'), hr_zone="90% FCmax"),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('easy'))
+                self._warmup_20.model_copy(),
+                PaceZone(description="6km allure course", distance_km=6.0, pace_min_per_km=self._pace_strings['race'], hr_zone="90% FCmax"),
+                self._cooldown_10.model_copy()
             ],
             is_key_session=True,
             week_number=1,
@@ -449,25 +600,31 @@ class Plan10kmGenerator:
         )
     
     def _create_sharpening_session(self) -> TrainingSession:
-        """Séance d'affûtage pré-course"""
+        """Séance d'affûtage pré-course (prototype mémorisé puis cloné)"""
+        if self._sharpening_template is None:
+            self._sharpening_template = self._build_sharpening_session()
+        return self._clone_template(self._sharpening_template)
+
+    def _build_sharpening_session(self) -> TrainingSession:
+        """Construit le prototype de la séance d'affûtage"""
         return TrainingSession(
             id="sharpening",
             title="Affûtage 6x800m",
             description="Intervalles moyens pour garder la vitesse",
-            session_type=SessionType.INTERVALS,
-            intensity=SessionIntensity.MODERATE,
+            session_type=_INTERVALS,
+            intensity=_MODERATE,
             duration_minutes=45,
             distance_km=7.0,
             structure=[
-                PaceZone(description="Échauffement", duration_minutes=20, pace_min_per_km=self.get_pace('easy')),
+                self._warmup_20.model_copy(),
                 PaceZone(
                     description="800m vif",
                     distance_km=0.8,
-                    pace_min_per_km=self.get_pace('interval'),
+                    pace_min_per_km=self._pace_strings['interval'],
                     repetitions=6,
                     recovery_minutes=2
                 ),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('easy'))
+                self._cooldown_10.model_copy()
             ],
             week_number=1,
             day_of_week=1,
@@ -509,3 +666,57 @@ def generate_10k_plan(
         athlete_profile=athlete_profile
     )
     return generator.generate_plan()
+
+
+def generate_10k_plans_bulk(specs: list[dict]) -> list[TrainingPlan]:
+    """
+    Génère plusieurs plans 10km en une seule passe.
+
+    Les allures des athlètes sans VMA connue sont calculées en une opération
+    NumPy vectorisée (vecteur d'allures cibles × décalages de zones) au lieu
+    de N appels scalaires à calculate_training_paces_from_target, puis chaque
+    plan est matérialisé par la classe existante.
+
+    Args:
+        specs: Liste de dicts avec les mêmes clés que les arguments de
+            Plan10kmGenerator (athlete_id, start_date, race_date, ...)
+
+    Returns:
+        Liste de TrainingPlan, dans l'ordre des specs
+    """
+    import numpy as np  # Import différé : inutile pour la génération unitaire
+
+    # Specs sans profil VMA mais avec objectif : allures vectorisables
+    def _vectorizable(spec):
+        profile = spec.get('athlete_profile')
+        return not (profile and profile.vma_kmh) and spec.get('target_time_minutes', 40)
+
+    bulk_indices = [i for i, spec in enumerate(specs) if _vectorizable(spec)]
+    paces_by_index = {}
+    if bulk_indices:
+        target_sec = np.asarray(
+            [specs[i].get('target_time_minutes', 40) for i in bulk_indices],
+            dtype=np.float64
+        ) * 6.0  # secondes/km sur 10km
+        deltas = np.asarray(
+            [d for _, zone_deltas in _BULK_ZONE_DELTAS for d in zone_deltas],
+            dtype=np.float64
+        )
+        # Une seule passe C pour toute l'arithmétique d'allures du lot
+        all_sec = (target_sec[:, None] + deltas[None, :]).astype(np.int64)
+        minutes, seconds = np.divmod(all_sec, 60)
+        for row, i in enumerate(bulk_indices):
+            row_strings = [
+                f"{m}:{s:02d}"
+                for m, s in zip(minutes[row].tolist(), seconds[row].tolist())
+            ]
+            paces = {}
+            for k, (zone, _) in enumerate(_BULK_ZONE_DELTAS):
+                pace_min, pace_max, pace_target = row_strings[3 * k:3 * k + 3]
+                paces[zone] = {'min': pace_min, 'max': pace_max, 'target': pace_target}
+            paces_by_index[i] = paces
+
+    return [
+        Plan10kmGenerator(**spec, precomputed_paces=paces_by_index.get(i)).generate_plan()
+        for i, spec in enumerate(specs)
+    ]
@@ -1,16 +1,49 @@
 """
 Générateur de plan d'entraînement pour 5km
 """
-from datetime import date, timedelta
+from datetime import date
 from models import (
     TrainingPlan, TrainingWeek, TrainingSession,
     TrainingPhase, WeekType, SessionType, SessionIntensity, PaceZone
 )
 from models.athlete_profile import AthleteProfile
-from utils.pace_calculator import calculate_training_paces_from_vma, estimate_race_time
+from utils.pace_calculator import (
+    calculate_training_paces_from_vma, calculate_training_paces_from_target
+)
 from typing import Optional
 
 
+# Mapping des zones pour compatibilité VMA (construit une seule fois au module)
+_ZONE_MAPPING = {
+    'race': '5k_race',  # Pour 5km, race = 5k_race (95-98% VMA)
+    # 'easy' reste 'easy' (70-75% VMA) - PAS endurance !
+    # 'interval' correspond à allure 5k ou plus rapide
+}
+
+# Répartitions de phases (base, build, peak, taper) par durée de plan,
+# partagées entre toutes les instances au lieu d'un dict alloué par plan
+_PHASES_SHORT = (1, 2, 1, 0)   # <= 4 semaines : focus intensité
+_PHASES_MED = (2, 2, 1, 1)     # 5-6 semaines
+_PHASES_LONG = (3, 3, 1, 1)    # 7-8 semaines
+
+
+def _sec_to_pace(sec: float) -> str:
+    """Formate une allure en secondes/km au format "M:SS" """
+    minutes, seconds = divmod(int(sec), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+# Allures de repli (ni VMA ni objectif) : dérivées de l'objectif par défaut
+# de 20min (4:00/km), construites une seule fois au chargement du module
+_DEFAULT_PACES = {
+    'easy': '5:00',       # +1min/km
+    'tempo': '4:15',      # +15sec/km
+    'threshold': '4:05',  # +5sec/km
+    'interval': '3:55',   # -5sec/km (plus rapide)
+    'race': '4:00'
+}
+
+
 class Plan5kmGenerator:
     """
     Génère un plan d'entraînement pour 5km (4-8 semaines)
@@ -41,58 +74,110 @@ class Plan5kmGenerator:
         self.athlete_profile = athlete_profile
         
         # Calculer durée
-        self.duration_weeks = (race_date - start_date).days // 7
-        
+        self._start_ordinal = start_date.toordinal()
+        self.duration_weeks = (race_date.toordinal() - self._start_ordinal) // 7
+
+        # Allure cible "M:SS" depuis l'objectif de temps (pas VMA), formatée une fois
+        self._target_pace = _sec_to_pace(target_time_minutes * 12)  # secondes/km sur 5km
+
+        # Métadonnées du plan formatées une seule fois (id/nom/description/objectif)
+        minutes_str = str(target_time_minutes)
+        self._plan_id = "_".join(("5k", minutes_str + "min", athlete_id, start_date.isoformat()))
+        self._plan_name = f"5km Sub {minutes_str}min"
+        self._plan_description = f"Plan structuré pour courir 5km en moins de {minutes_str} minutes"
+        self._goal_time = minutes_str + ":00"
+
         # Calculer l'allure cible en min/km si objectif fourni
         target_pace_min_per_km = None
         if target_time_minutes:
             target_pace_min_per_km = target_time_minutes / 5  # 5km
         
-        # Allures selon objectif (ou VMA si profil disponible)
-        if athlete_profile and athlete_profile.vma_kmh:
-            # Utiliser VMA pour calculer toutes les allures
-            self.paces_raw = calculate_training_paces_from_vma(
-                athlete_profile.vma_kmh,
-                fc_max=athlete_profile.max_heart_rate,
-                fc_repos=athlete_profile.resting_heart_rate,
-                level=athlete_profile.training_level,
-                target_pace_min_per_km=target_pace_min_per_km,
-                distance_km=5
-            )
-            self.using_vma = True
-            # Ajuster l'objectif de temps selon VMA si nécessaire
-            est_minutes, est_time = estimate_race_time(5, athlete_profile.vma_kmh)
-        elif target_time_minutes:
-            # Calculer depuis l'objectif de temps SANS VMA
-            from utils.pace_calculator import calculate_training_paces_from_target
-            self.paces_raw = calculate_training_paces_from_target(target_time_minutes, 5)
-            self.using_vma = True  # Même format de sortie
-        else:
-            # Ni VMA ni objectif : utiliser valeurs par défaut
-            self.paces_raw = self._calculate_paces()
-            self.using_vma = False
-    
+        # Allures selon objectif (ou VMA si profil disponible) : dispatch par
+        # table indexée (has_vma, has_target) au lieu de branches imbriquées
+        has_vma = bool(athlete_profile and athlete_profile.vma_kmh)
+        has_target = bool(target_time_minutes)
+        resolver = self._PACE_RESOLVERS[has_vma * 2 + has_target]
+        self.paces_raw, self.using_vma = resolver(self, target_pace_min_per_km)
+
+        # Bornes cumulées des phases (semaine de fin incluse), calculées une fois
+        base, build, peak, _taper = self._calculate_phases()
+        self._base_end = base
+        self._build_end = base + build
+        self._peak_end = base + build + peak
+
+        # Résoudre chaque allure une seule fois : {zone: ("M:SS", float min/km)}
+        # pour éviter les re-parsings de string à chaque création de séance
+        self._pace_cache: dict[str, tuple[str, float]] = {}
+        self._resolved_paces: dict[tuple[str, str], str] = {}
+        for zone in ('easy', 'tempo', 'threshold', 'interval', 'race'):
+            pace = self._resolve_pace(zone)
+            minutes, seconds = pace.split(':')
+            self._pace_cache[zone] = (pace, int(minutes) + int(seconds) / 60.0)
+            for pace_type in ('min', 'max', 'target'):
+                self._resolved_paces[(zone, pace_type)] = self._resolve_pace(zone, pace_type)
+
+        # Décalages des jours préférés en jours entiers : l'arithmétique de dates
+        # passe par les ordinaux (un int par date au lieu d'objets timedelta)
+        self._day_offsets = tuple(d - 1 for d in self.preferred_days)
+
+        # Prototypes des portions répétées dans toutes les séances de qualité ;
+        # clonés via model_copy dans les builders (pas de revalidation pydantic,
+        # et les zones restent modifiables en place en aval sans effet de bord)
+        easy_pace = self._pace_cache['easy'][0]
+        self._easy_templates: dict[tuple[int, str], TrainingSession] = {}
+        self._warmup_10 = PaceZone(description="Échauffement", duration_minutes=10,
+                                   pace_min_per_km=easy_pace)
+        self._warmup_15 = PaceZone(description="Échauffement", duration_minutes=15,
+                                   pace_min_per_km=easy_pace)
+        self._cooldown_10 = PaceZone(description="Retour au calme", duration_minutes=10,
+                                     pace_min_per_km=easy_pace)
+
+    def _paces_from_vma(self, target_pace_min_per_km: Optional[float]) -> tuple[dict, bool]:
+        """Toutes les allures depuis la VMA du profil"""
+        return calculate_training_paces_from_vma(
+            self.athlete_profile.vma_kmh,
+            fc_max=self.athlete_profile.max_heart_rate,
+            fc_repos=self.athlete_profile.resting_heart_rate,
+            level=self.athlete_profile.training_level,
+            target_pace_min_per_km=target_pace_min_per_km,
+            distance_km=5
+        ), True
+
+    def _paces_from_target(self, target_pace_min_per_km: Optional[float]) -> tuple[dict, bool]:
+        """Allures depuis l'objectif de temps SANS VMA (même format de sortie)"""
+        return calculate_training_paces_from_target(self.target_time_minutes, 5), True
+
+    def _paces_default(self, target_pace_min_per_km: Optional[float]) -> tuple[dict, bool]:
+        """Ni VMA ni objectif : table de repli partagée au niveau du module"""
+        return _DEFAULT_PACES, False
+
+    # Table de dispatch indexée par has_vma * 2 + has_target
+    _PACE_RESOLVERS = (_paces_default, _paces_from_target, _paces_from_vma, _paces_from_vma)
+
     def get_pace(self, zone: str, pace_type: str = 'target') -> str:
         """
-        Récupère une allure depuis le dictionnaire de paces.
-        Gère à la fois le format VMA (dict avec min/max/target) et le format simple (string).
-        
+        Récupère une allure depuis la table pré-résolue (un seul accès dict),
+        ou la résout à la demande pour les zones inconnues.
+
         Args:
             zone: Zone d'allure ('easy', 'tempo', 'threshold', 'interval', 'race')
             pace_type: Type d'allure ('min', 'max', 'target')
-        
+
         Returns:
             String au format "M:SS"
         """
-        # Mapping des zones pour compatibilité VMA
-        zone_mapping = {
-            'race': '5k_race',  # Pour 5km, race = 5k_race (95-98% VMA)
-            # 'easy' reste 'easy' (70-75% VMA) - PAS endurance !
-            # 'interval' correspond à allure 5k ou plus rapide
-        }
-        
-        # Appliquer le mapping si nécessaire
-        actual_zone = zone_mapping.get(zone, zone)
+        pace = self._resolved_paces.get((zone, pace_type))
+        if pace is not None:
+            return pace
+        return self._resolve_pace(zone, pace_type)
+
+    def _resolve_pace(self, zone: str, pace_type: str = 'target') -> str:
+        """
+        Résout une allure depuis le dictionnaire de paces.
+        Gère à la fois le format VMA (dict avec min/max/target) et le format simple (string).
+        """
+        # Appliquer le mapping de compatibilité VMA si nécessaire
+        actual_zone = _ZONE_MAPPING.get(zone, zone)
         
         if self.using_vma:
             # Format VMA: {'zone': {'min': 'M:SS', 'max': 'M:SS', 'target': 'M:SS'}}
@@ -110,47 +195,15 @@ class Plan5kmGenerator:
             # Format simple: {'zone': 'M:SS'}
             return self.paces_raw.get(zone, '5:00')
     
-    def _calculate_paces(self) -> dict:
-        """Calcule les allures d'entraînement selon l'objectif"""
-        target_pace_sec = (self.target_time_minutes * 60) / 5  # secondes/km
-        target_pace_min = int(target_pace_sec // 60)
-        target_pace_sec_rem = int(target_pace_sec % 60)
-        target_pace = f"{target_pace_min}:{target_pace_sec_rem:02d}"
-        
-        # Zones d'entraînement (en sec/km)
-        easy_pace_sec = target_pace_sec + 60  # +1min/km
-        tempo_pace_sec = target_pace_sec + 15  # +15sec/km
-        threshold_pace_sec = target_pace_sec + 5  # +5sec/km
-        interval_pace_sec = target_pace_sec - 5  # -5sec/km (plus rapide que course)
-        
-        def sec_to_pace(sec):
-            m = int(sec // 60)
-            s = int(sec % 60)
-            return f"{m}:{s:02d}"
-        
-        return {
-            'easy': sec_to_pace(easy_pace_sec),
-            'tempo': sec_to_pace(tempo_pace_sec),
-            'threshold': sec_to_pace(threshold_pace_sec),
-            'interval': sec_to_pace(interval_pace_sec),
-            'race': target_pace
-        }
-    
     def generate_plan(self) -> TrainingPlan:
         """Génère le plan complet"""
-        # Calculer l'allure cible depuis l'objectif de temps (pas VMA)
-        target_pace_sec = (self.target_time_minutes * 60) / 5  # secondes/km
-        target_pace_min = int(target_pace_sec // 60)
-        target_pace_sec_rem = int(target_pace_sec % 60)
-        target_pace = f"{target_pace_min}:{target_pace_sec_rem:02d}"
-        
         plan = TrainingPlan(
-            id=f"5k_{self.target_time_minutes}min_{self.athlete_id}_{self.start_date.isoformat()}",
-            name=f"5km Sub {self.target_time_minutes}min",
-            description=f"Plan structuré pour courir 5km en moins de {self.target_time_minutes} minutes",
+            id=self._plan_id,
+            name=self._plan_name,
+            description=self._plan_description,
             goal_distance="5km",
-            goal_time=f"{self.target_time_minutes}:00",
-            target_pace_per_km=target_pace,  # Utiliser l'objectif réel, pas VMA
+            goal_time=self._goal_time,
+            target_pace_per_km=self._target_pace,  # Utiliser l'objectif réel, pas VMA
             start_date=self.start_date,
             end_date=self.race_date,
             duration_weeks=self.duration_weeks,
@@ -159,64 +212,52 @@ class Plan5kmGenerator:
             athlete_id=self.athlete_id
         )
         
-        # Définir les phases
-        phases = self._calculate_phases()
-        
-        # Générer les semaines
-        for week_num in range(1, self.duration_weeks + 1):
-            phase = self._get_phase_for_week(week_num, phases)
-            week = self._generate_week(week_num, phase)
-            plan.add_week(week)
-        
+        # Générer les semaines (sélection de phase par comparaisons d'entiers,
+        # dates de début pré-calculées en une passe)
+        base_end, build_end, peak_end = self._base_end, self._build_end, self._peak_end
+        start_ordinal = self._start_ordinal
+        plan.weeks.extend(
+            self._generate_week(
+                week_num,
+                TrainingPhase.BASE if week_num <= base_end
+                else TrainingPhase.BUILD if week_num <= build_end
+                else TrainingPhase.PEAK if week_num <= peak_end
+                else TrainingPhase.TAPER,
+                start_ordinal + 7 * (week_num - 1)
+            )
+            for week_num in range(1, self.duration_weeks + 1)
+        )
+
         return plan
     
-    def _calculate_phases(self) -> dict:
-        """Calcule la répartition des phases pour 5km"""
+    def _calculate_phases(self) -> tuple:
+        """Répartition des phases pour 5km : tuple (base, build, peak, taper) partagé"""
         total = self.duration_weeks
-        
         if total <= 4:
-            # Plan court : focus intensité
-            return {
-                'base': 1,
-                'build': 2,
-                'peak': 1,
-                'taper': 0  # Dernière semaine de peak = taper léger
-            }
+            # Plan court : focus intensité (dernière semaine de peak = taper léger)
+            return _PHASES_SHORT
         elif total <= 6:
-            return {
-                'base': 2,
-                'build': 2,
-                'peak': 1,
-                'taper': 1
-            }
+            return _PHASES_MED
         else:  # 7-8 semaines
-            return {
-                'base': 3,
-                'build': 3,
-                'peak': 1,
-                'taper': 1
-            }
+            return _PHASES_LONG
     
-    def _get_phase_for_week(self, week_num: int, phases: dict) -> TrainingPhase:
-        """Détermine la phase pour une semaine donnée"""
-        if week_num <= phases['base']:
+    def _get_phase_for_week(self, week_num: int) -> TrainingPhase:
+        """Détermine la phase pour une semaine donnée (bornes pré-calculées)"""
+        if week_num <= self._base_end:
             return TrainingPhase.BASE
-        elif week_num <= phases['base'] + phases['build']:
+        elif week_num <= self._build_end:
             return TrainingPhase.BUILD
-        elif week_num <= phases['base'] + phases['build'] + phases['peak']:
+        elif week_num <= self._peak_end:
             return TrainingPhase.PEAK
         else:
             return TrainingPhase.TAPER
     
-    def _generate_week(self, week_num: int, phase: TrainingPhase) -> TrainingWeek:
-        """Génère une semaine d'entraînement"""
-        week_start = self.start_date + timedelta(weeks=week_num - 1)
-        week_end = week_start + timedelta(days=6)
-        
+    def _generate_week(self, week_num: int, phase: TrainingPhase, week_ordinal: int) -> TrainingWeek:
+        """Génère une semaine d'entraînement (dates reconstruites depuis l'ordinal)"""
         week = TrainingWeek(
             week_number=week_num,
-            start_date=week_start,
-            end_date=week_end,
+            start_date=date.fromordinal(week_ordinal),
+            end_date=date.fromordinal(week_ordinal + 6),
             phase=phase,
             week_type=WeekType.PEAK if phase == TrainingPhase.PEAK else WeekType.NORMAL
         )
@@ -227,7 +268,7 @@ class Plan5kmGenerator:
         for i, session in enumerate(sessions, 1):
             if i <= len(self.preferred_days):
                 session.day_of_week = self.preferred_days[i - 1]
-                session.scheduled_date = week_start + timedelta(days=session.day_of_week - 1)
+                session.scheduled_date = date.fromordinal(week_ordinal + self._day_offsets[i - 1])
                 session.week_number = week_num
                 session.session_number = i
                 week.sessions.append(session)
@@ -235,50 +276,85 @@ class Plan5kmGenerator:
         return week
     
     def _create_sessions_for_phase(self, week_num: int, phase: TrainingPhase) -> list[TrainingSession]:
-        """Crée les séances selon la phase"""
-        sessions = []
-        
-        if phase == TrainingPhase.BASE:
-            # Phase de base : développer l'endurance
-            sessions.append(self._create_easy_run(30, "Footing facile"))
+        """Crée les séances selon la phase (dispatch par table, sans séance écartée)"""
+        return self._PHASE_BUILDERS[phase](self, week_num)
+
+    def _build_base_week(self, week_num: int) -> list[TrainingSession]:
+        """Phase de base : développer l'endurance"""
+        # Vérifier le quota AVANT de construire : chaque builder alloue un arbre
+        # TrainingSession + PaceZone complet qui serait jeté par une troncature
+        quota = self.sessions_per_week
+        sessions = [self._create_easy_run(30, "Footing facile")]
+        if quota >= 2:
             sessions.append(self._create_tempo_session(week_num))
+        if quota >= 3:
             sessions.append(self._create_easy_run(35, "Footing récupération"))
-            if self.sessions_per_week >= 4:
-                sessions.append(self._create_easy_run(40, "Sortie longue"))
-        
-        elif phase == TrainingPhase.BUILD:
-            # Phase de développement : intervalles
-            sessions.append(self._create_easy_run(30, "Footing facile"))
+        if quota >= 4:
+            sessions.append(self._create_easy_run(40, "Sortie longue"))
+        return sessions
+
+    def _build_build_week(self, week_num: int) -> list[TrainingSession]:
+        """Phase de développement : intervalles"""
+        quota = self.sessions_per_week
+        sessions = [self._create_easy_run(30, "Footing facile")]
+        if quota >= 2:
             sessions.append(self._create_interval_session(week_num))
+        if quota >= 3:
             sessions.append(self._create_easy_run(30, "Récupération"))
-            if self.sessions_per_week >= 4:
-                sessions.append(self._create_threshold_session(week_num))
-        
-        elif phase == TrainingPhase.PEAK:
-            # Phase pic : spécifique 5km
-            sessions.append(self._create_easy_run(25, "Footing léger"))
+        if quota >= 4:
+            sessions.append(self._create_threshold_session(week_num))
+        return sessions
+
+    def _build_peak_week(self, week_num: int) -> list[TrainingSession]:
+        """Phase pic : spécifique 5km"""
+        quota = self.sessions_per_week
+        sessions = [self._create_easy_run(25, "Footing léger")]
+        if quota >= 2:
             sessions.append(self._create_race_pace_session(week_num))
+        if quota >= 3:
             sessions.append(self._create_easy_run(25, "Récupération active"))
-            if self.sessions_per_week >= 4:
-                sessions.append(self._create_interval_session(week_num, short=True))
-        
-        else:  # TAPER
-            # Affûtage : réduire le volume, garder l'intensité
-            sessions.append(self._create_easy_run(20, "Footing très léger"))
+        if quota >= 4:
+            sessions.append(self._create_interval_session(week_num, short=True))
+        return sessions
+
+    def _build_taper_week(self, week_num: int) -> list[TrainingSession]:
+        """Affûtage : réduire le volume, garder l'intensité"""
+        quota = self.sessions_per_week
+        sessions = [self._create_easy_run(20, "Footing très léger")]
+        if quota >= 2:
             sessions.append(self._create_sharpening_session())
+        if quota >= 3:
             sessions.append(self._create_easy_run(15, "Activation pré-course"))
-        
-        return sessions[:self.sessions_per_week]
-    
+        return sessions
+
+    # Table de dispatch phase → builder, partagée par la classe (pas de chaîne
+    # de comparaisons d'enum à chaque semaine générée)
+    _PHASE_BUILDERS = {
+        TrainingPhase.BASE: _build_base_week,
+        TrainingPhase.BUILD: _build_build_week,
+        TrainingPhase.PEAK: _build_peak_week,
+        TrainingPhase.TAPER: _build_taper_week,
+    }
+
+
     def _create_easy_run(self, duration: int, title: str) -> TrainingSession:
-        """Crée un footing facile"""
-        # Calculer la distance correctement depuis l'allure
-        pace_str = self.get_pace('easy')
-        pace_parts = pace_str.split(':')
-        pace_min_per_km = int(pace_parts[0]) + int(pace_parts[1]) / 60.0
-        distance = round(duration / pace_min_per_km, 1)
-        
-        return TrainingSession(
+        """Crée un footing facile (prototype mémorisé par (durée, titre), cloné)"""
+        template = self._easy_templates.get((duration, title))
+        if template is None:
+            template = self._build_easy_template(duration, title)
+            self._easy_templates[(duration, title)] = template
+        # Clone indépendant : adapt_session modifie les zones en place en aval
+        return template.model_copy(
+            update={'structure': [zone.model_copy() for zone in template.structure]}
+        )
+
+    def _build_easy_template(self, duration: int, title: str) -> TrainingSession:
+        """Construit le prototype d'un footing facile"""
+        # Un seul accès au cache : la paire (string, float min/km) est dépaquetée
+        pace_str, pace_min = self._pace_cache['easy']
+        distance = round(duration / pace_min, 1)
+
+        return TrainingSession.model_construct(
             id=f"easy_{duration}min",
             title=title,
             description=f"Course facile de {duration} minutes à allure confortable",
@@ -287,23 +363,20 @@ class Plan5kmGenerator:
             duration_minutes=duration,
             distance_km=distance,
             structure=[
-                PaceZone(
+                PaceZone.model_construct(
                     description="Footing facile",
                     duration_minutes=duration,
-                    pace_min_per_km=self.get_pace('easy'),
+                    pace_min_per_km=pace_str,
                     hr_zone="65-75% FCmax"
                 )
-            ],
-            week_number=1,
-            day_of_week=1,
-            session_number=1
+            ]
         )
     
     def _create_tempo_session(self, week_num: int) -> TrainingSession:
         """Crée une séance tempo"""
         duration = 15 + (week_num - 1) * 2  # Progression
         
-        return TrainingSession(
+        return TrainingSession.model_construct(
             id=f"tempo_{week_num}",
             title=f"Tempo {duration}min",
             description=f"Allure soutenue pendant {duration} minutes",
@@ -312,14 +385,11 @@ class Plan5kmGenerator:
             duration_minutes=45,
             distance_km=7.0,
             structure=[
-                PaceZone(description="Échauffement", duration_minutes=10, pace_min_per_km=self.get_pace('easy')),
-                PaceZone(description="Tempo", duration_minutes=duration, pace_min_per_km=self.get_pace('tempo'), hr_zone="80-85% FCmax"),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('easy'))
+                self._warmup_10.model_copy(),
+                PaceZone.model_construct(description="Tempo", duration_minutes=duration, pace_min_per_km=self._pace_cache['tempo'][0], hr_zone="80-85% FCmax"),
+                self._cooldown_10.model_copy()
             ],
-            is_key_session=True,
-            week_number=1,
-            day_of_week=1,
-            session_number=1
+            is_key_session=True
         )
     
     def _create_interval_session(self, week_num: int, short: bool = False) -> TrainingSession:
@@ -337,7 +407,7 @@ class Plan5kmGenerator:
             recovery = 1.5
             title = f"{reps}x2min"
         
-        return TrainingSession(
+        return TrainingSession.model_construct(
             id=f"intervals_{week_num}",
             title=title,
             description=f"{reps} répétitions de {duration}min à allure intervalle",
@@ -346,21 +416,18 @@ class Plan5kmGenerator:
             duration_minutes=50,
             distance_km=8.0,
             structure=[
-                PaceZone(description="Échauffement", duration_minutes=15, pace_min_per_km=self.get_pace('easy')),
-                PaceZone(
+                self._warmup_15.model_copy(),
+                PaceZone.model_construct(
                     description=f"Intervalle {duration}min",
                     duration_minutes=duration,
-                    pace_min_per_km=self.get_pace('interval'),
+                    pace_min_per_km=self._pace_cache['interval'][0],
                     hr_zone="90-95% FCmax",
                     repetitions=reps,
                     recovery_minutes=recovery
                 ),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('easy'))
+                self._cooldown_10.model_copy()
             ],
-            is_key_session=True,
-            week_number=1,
-            day_of_week=1,
-            session_number=1
+            is_key_session=True
         )
     
     def _create_threshold_session(self, week_num: int) -> TrainingSession:
@@ -368,7 +435,7 @@ class Plan5kmGenerator:
         reps = 2 + min((week_num - 3) // 2, 2)  # 2 à 4 reps
         duration = 5
         
-        return TrainingSession(
+        return TrainingSession.model_construct(
             id=f"threshold_{week_num}",
             title=f"{reps}x{duration}min au seuil",
             description=f"{reps} fractions de {duration}min à allure seuil",
@@ -377,26 +444,23 @@ class Plan5kmGenerator:
             duration_minutes=50,
             distance_km=8.5,
             structure=[
-                PaceZone(description="Échauffement", duration_minutes=15, pace_min_per_km=self.get_pace('easy')),
-                PaceZone(
+                self._warmup_15.model_copy(),
+                PaceZone.model_construct(
                     description=f"Seuil {duration}min",
                     duration_minutes=duration,
-                    pace_min_per_km=self.get_pace('threshold'),
+                    pace_min_per_km=self._pace_cache['threshold'][0],
                     hr_zone="85-90% FCmax",
                     repetitions=reps,
                     recovery_minutes=2
                 ),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('easy'))
+                self._cooldown_10.model_copy()
             ],
-            is_key_session=True,
-            week_number=1,
-            day_of_week=1,
-            session_number=1
+            is_key_session=True
         )
     
     def _create_race_pace_session(self, week_num: int) -> TrainingSession:
         """Crée une séance à allure course"""
-        return TrainingSession(
+        return TrainingSession.model_construct(
             id=f"race_pace_{week_num}",
             title="3km allure course",
             description="3km à l'allure cible de la course",
@@ -405,19 +469,16 @@ class Plan5kmGenerator:
             duration_minutes=45,
             distance_km=7.0,
             structure=[
-                PaceZone(description="Échauffement", duration_minutes=15, pace_min_per_km=self.get_pace('easy')),
-                PaceZone(description="3km allure course", distance_km=3.0, pace_min_per_km=self.get_pace('race'), hr_zone="90% FCmax"),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('easy'))
+                self._warmup_15.model_copy(),
+                PaceZone.model_construct(description="3km allure course", distance_km=3.0, pace_min_per_km=self._pace_cache['race'][0], hr_zone="90% FCmax"),
+                self._cooldown_10.model_copy()
             ],
-            is_key_session=True,
-            week_number=1,
-            day_of_week=1,
-            session_number=1
+            is_key_session=True
         )
     
     def _create_sharpening_session(self) -> TrainingSession:
         """Séance d'affûtage pré-course"""
-        return TrainingSession(
+        return TrainingSession.model_construct(
             id="sharpening",
             title="Affûtage 5x400m",
             description="Courts intervalles pour garder la vitesse",
@@ -426,22 +487,25 @@ class Plan5kmGenerator:
             duration_minutes=35,
             distance_km=5.0,
             structure=[
-                PaceZone(description="Échauffement", duration_minutes=15, pace_min_per_km=self.get_pace('easy')),
-                PaceZone(
+                self._warmup_15.model_copy(),
+                PaceZone.model_construct(
                     description="400m vif",
                     distance_km=0.4,
-                    pace_min_per_km=self.get_pace('interval'),
+                    pace_min_per_km=self._pace_cache['interval'][0],
                     repetitions=5,
                     recovery_minutes=1.5
                 ),
-                PaceZone(description="Retour au calme", duration_minutes=10, pace_min_per_km=self.get_pace('easy'))
-            ],
-            week_number=1,
-            day_of_week=1,
-            session_number=1
+                self._cooldown_10.model_copy()
+            ]
         )
 
 
+# Cache des plans générés : mêmes entrées → plan identique, inutile de
+# reconstruire des centaines d'objets à chaque rafraîchissement
+_PLAN_CACHE: dict[tuple, TrainingPlan] = {}
+_PLAN_CACHE_MAX = 256
+
+
 def generate_5k_plan(
     athlete_id: str,
     start_date: date,
@@ -466,6 +530,29 @@ def generate_5k_plan(
     Returns:
         TrainingPlan complet
     """
+    # Clé hashable : le profil est résumé aux champs qui influencent le plan
+    profile_key = None
+    if athlete_profile:
+        profile_key = (
+            athlete_profile.vma_kmh,
+            athlete_profile.max_heart_rate,
+            athlete_profile.resting_heart_rate,
+            athlete_profile.training_level
+        )
+    cache_key = (
+        athlete_id,
+        start_date.isoformat(),
+        race_date.isoformat(),
+        target_time_minutes,
+        sessions_per_week,
+        tuple(preferred_days) if preferred_days else None,
+        profile_key
+    )
+
+    plan = _PLAN_CACHE.get(cache_key)
+    if plan is not None:
+        return plan
+
     generator = Plan5kmGenerator(
         athlete_id=athlete_id,
         start_date=start_date,
@@ -475,4 +562,9 @@ def generate_5k_plan(
         preferred_days=preferred_days,
         athlete_profile=athlete_profile
     )
-    return generator.generate_plan()
+    plan = generator.generate_plan()
+
+    if len(_PLAN_CACHE) >= _PLAN_CACHE_MAX:
+        _PLAN_CACHE.clear()
+    _PLAN_CACHE[cache_key] = plan
+    return plan
@@ -1,18 +1,38 @@
 """
 Moteur d'adaptation intelligente des séances d'entraînement
 """
+from bisect import bisect_right
+from collections import deque
 from datetime import date, datetime, timedelta
+from dataclasses import dataclass, field
 from typing import Optional, Tuple
-from enum import Enum
+from enum import StrEnum
 
 from models import (
     TrainingSession, DailyMetrics, SessionType, SessionIntensity,
-    SessionStatus, ReadinessLevel
+    SessionStatus, ReadinessLevel, PaceZone
 )
-from config.settings import RECOVERY_THRESHOLDS, ACWR_OPTIMAL_MIN, ACWR_OPTIMAL_MAX
+from config.settings import (
+    RECOVERY_THRESHOLDS, ACWR_OPTIMAL_MIN, ACWR_OPTIMAL_MAX, ACWR_CAUTION_MAX
+)
+
+
+# Facteurs de charge par bande ACWR (sous-entraîné, optimal, surchargé,
+# fortement surchargé) : indexés sans branche par somme de comparaisons
+_ACWR_FACTORS = (0.9, 1.0, 0.6, 0.3)
 
+# Détails non paramétriques partagés au niveau du module : les analyseurs
+# ajoutent une référence au lieu de reconstruire la même string à chaque appel
+_DETAIL_NO_CALENDAR = "📅 Agenda: Pas de données de disponibilité"
+_DETAIL_2PLUS_INTENSE = "⚠️ Enchaînement: 2+ séances intenses dans les 48h"
+_DETAIL_1_INTENSE = "ℹ️ Enchaînement: 1 séance intense récente"
 
-class AdaptationAction(str, Enum):
+# Intensités considérées comme "intenses" : frozenset partagé, testé par
+# hachage au lieu de construire une liste à chaque comparaison
+_INTENSE_INTENSITIES = frozenset({SessionIntensity.HARD, SessionIntensity.VERY_HARD})
+
+
+class AdaptationAction(StrEnum):
     """Actions possibles d'adaptation"""
     MAINTAIN = "Maintenir"
     MONITOR = "Maintenir avec surveillance"
@@ -22,27 +42,20 @@ class AdaptationAction(str, Enum):
     CANCEL = "Annuler"
 
 
+@dataclass(slots=True, frozen=True)
 class AdaptationRecommendation:
-    """Recommandation d'adaptation d'une séance"""
-    
-    def __init__(
-        self,
-        action: AdaptationAction,
-        reason: str,
-        details: list[str],
-        modified_session: Optional[TrainingSession] = None,
-        confidence: float = 1.0
-    ):
-        self.action = action
-        self.reason = reason
-        self.details = details  # Liste des facteurs pris en compte
-        self.modified_session = modified_session
-        self.confidence = confidence  # 0-1
-    
+    """Recommandation d'adaptation d'une séance (immuable, sans __dict__)"""
+    action: AdaptationAction
+    reason: str
+    details: list[str] = field(default_factory=list)  # Facteurs pris en compte
+    modified_session: Optional[TrainingSession] = None
+    confidence: float = 1.0  # 0-1
+
     def to_dict(self) -> dict:
-        """Convertit en dictionnaire"""
+        """Convertit en dictionnaire (construit à la main : asdict récurserait
+        dans modified_session)"""
         return {
-            'action': self.action.value,
+            'action': str(self.action),
             'reason': self.reason,
             'details': self.details,
             'confidence': self.confidence,
@@ -50,6 +63,51 @@ class AdaptationRecommendation:
         }
 
 
+# Recommandations pré-construites pour les régimes extrêmes du score de
+# récupération (aucune séance modifiée : partage sans risque)
+_FAST_MAINTAIN = AdaptationRecommendation(
+    action=AdaptationAction.MAINTAIN,
+    reason="✅ Conditions optimales pour la séance planifiée",
+    details=["💤 Récupération excellente (score ≥ 95)"],
+    confidence=1.0
+)
+_FAST_CANCEL = AdaptationRecommendation(
+    action=AdaptationAction.CANCEL,
+    reason="🛑 Récupération insuffisante: repos complet recommandé",
+    details=["💤 Récupération très dégradée (score ≤ 15)"],
+    confidence=1.0
+)
+
+
+class IntenseSessionWindow:
+    """
+    Compteur glissant des séances intenses terminées dans les 48 dernières heures
+
+    Alimenté au fil de l'eau quand une séance est complétée, ce qui évite de
+    re-filtrer tout l'historique (arithmétique datetime en O(n)) à chaque
+    appel d'adaptation : la lecture est en O(1) amorti.
+    """
+    __slots__ = ('_completed',)
+
+    WINDOW = timedelta(hours=48)
+
+    def __init__(self):
+        self._completed: deque[datetime] = deque()
+
+    def record(self, session: TrainingSession):
+        """Enregistre une séance complétée si elle est intense"""
+        if session.completed_at and session.intensity in _INTENSE_INTENSITIES:
+            self._completed.append(session.completed_at)
+
+    def intense_count_last_48h(self, now: Optional[datetime] = None) -> int:
+        """Nombre de séances intenses dans la fenêtre (purge les expirées)"""
+        cutoff = (now or datetime.now()) - self.WINDOW
+        completed = self._completed
+        while completed and completed[0] < cutoff:
+            completed.popleft()
+        return len(completed)
+
+
 class SessionAdapter:
     """
     Adaptateur intelligent de séances d'entraînement
@@ -63,38 +121,66 @@ class SessionAdapter:
     
     def __init__(self):
         self.thresholds = RECOVERY_THRESHOLDS
+        # Seuils dépliés une fois : la cascade de décision lit quatre locaux
+        # au lieu de quatre accès dict par appel
+        self._t_excellent = RECOVERY_THRESHOLDS['excellent']
+        self._t_good = RECOVERY_THRESHOLDS['good']
+        self._t_moderate = RECOVERY_THRESHOLDS['moderate']
+        self._t_poor = RECOVERY_THRESHOLDS['poor']
     
     def adapt_session(
         self,
         session: TrainingSession,
         metrics: DailyMetrics,
         upcoming_sessions: list[TrainingSession] = None,
-        recent_sessions: list[TrainingSession] = None
+        recent_sessions: list[TrainingSession] = None,
+        intense_window: Optional[IntenseSessionWindow] = None
     ) -> AdaptationRecommendation:
         """
         Adapte une séance en fonction des métriques du jour
-        
+
         Args:
             session: Séance planifiée
             metrics: Métriques du jour
             upcoming_sessions: Prochaines séances (pour optimisation)
             recent_sessions: Séances récentes (pour contexte)
-        
+            intense_window: Compteur glissant des séances intenses (évite
+                de re-scanner recent_sessions à chaque appel)
+
         Returns:
             AdaptationRecommendation
         """
         # 1. Calculer le score de récupération si pas déjà fait
         if metrics.recovery_score is None:
             metrics.calculate_recovery_score()
-        
+
         recovery_score = metrics.recovery_score or 50.0
-        details = []
-        
-        # 2. Analyser les différents facteurs
-        recovery_factor = self._analyze_recovery(recovery_score, metrics, details)
+
+        # Court-circuit des régimes extrêmes : inutile de dérouler les quatre
+        # analyses (et leurs strings de détail) quand le score impose l'issue
+        if recovery_score >= 95 and metrics.available_time_slots:
+            return _FAST_MAINTAIN
+        if recovery_score <= 15:
+            return _FAST_CANCEL
+
+        # 2. Analyser les différents facteurs. Récupération et charge ne
+        # dépendent pas de la séance : leur analyse est mise en cache sur les
+        # métriques pour les adaptations multiples d'une même journée
+        bundle = metrics._cached_analysis
+        if bundle is None:
+            shared_details = []
+            recovery_factor = self._analyze_recovery(recovery_score, metrics, shared_details)
+            load_factor = self._analyze_training_load(metrics, recent_sessions, shared_details)
+            bundle = (recovery_factor, load_factor, shared_details)
+            metrics._cached_analysis = bundle
+        else:
+            recovery_factor, load_factor, shared_details = bundle
+
+        details = list(shared_details)
         availability_factor = self._analyze_availability(session, metrics, details)
-        load_factor = self._analyze_training_load(metrics, recent_sessions, details)
-        sequence_factor = self._analyze_sequence(session, recent_sessions, upcoming_sessions, details)
+        sequence_factor = self._analyze_sequence(
+            session, recent_sessions, upcoming_sessions, details, intense_window
+        )
         
         # 3. Décider de l'action
         action, reason, modified = self._decide_action(
@@ -152,7 +238,7 @@ class SessionAdapter:
         Returns: facteur 0-1 (1 = parfaite dispo)
         """
         if not metrics.available_time_slots:
-            details.append("📅 Agenda: Pas de données de disponibilité")
+            details.append(_DETAIL_NO_CALENDAR)
             return 0.5  # Neutre si pas d'info
         
         # Vérifier s'il y a assez de temps
@@ -179,51 +265,45 @@ class SessionAdapter:
             return 0.7  # Neutre
         
         acwr = metrics.training_load.acwr
-        
-        # ACWR optimal entre 0.8 et 1.3
-        if ACWR_OPTIMAL_MIN <= acwr <= ACWR_OPTIMAL_MAX:
-            return 1.0
-        elif acwr < ACWR_OPTIMAL_MIN:
-            # Sous-entraîné: peut charger davantage
-            return 0.9
-        elif acwr <= 1.5:
-            # Légèrement surchargé
-            return 0.6
-        else:
-            # Fortement surchargé
-            return 0.3
+
+        # ACWR optimal entre 0.8 et 1.3 ; indexation directe dans la table des
+        # facteurs au lieu d'une cascade de if/elif (chaque comparaison vaut
+        # 0 ou 1, leur somme donne la bande)
+        idx = (acwr >= ACWR_OPTIMAL_MIN) + (acwr > ACWR_OPTIMAL_MAX) + (acwr > ACWR_CAUTION_MAX)
+        return _ACWR_FACTORS[idx]
     
     def _analyze_sequence(
         self,
         session: TrainingSession,
         recent_sessions: Optional[list[TrainingSession]],
         upcoming_sessions: Optional[list[TrainingSession]],
-        details: list[str]
+        details: list[str],
+        intense_window: Optional[IntenseSessionWindow] = None
     ) -> float:
         """
         Analyse l'enchaînement des séances
         Returns: facteur 0-1
         """
-        if not recent_sessions:
+        if intense_window is not None:
+            # Compteur entretenu au fil de l'eau : lecture O(1)
+            intense_recent = intense_window.intense_count_last_48h()
+        elif recent_sessions:
+            # Repli sans compteur : un seul datetime.now() pour tout le scan,
+            # et comparaison directe de datetimes (pas de timedelta par séance)
+            cutoff = datetime.now() - timedelta(days=2)
+            intense_recent = sum(
+                1 for s in recent_sessions
+                if s.completed_at and s.completed_at >= cutoff
+                and s.intensity in _INTENSE_INTENSITIES
+            )
+        else:
             return 1.0
-        
-        # Vérifier les dernières 48h
-        last_48h = [
-            s for s in recent_sessions
-            if s.completed_at and (datetime.now() - s.completed_at).days <= 2
-        ]
-        
-        # Compter les séances intenses récentes
-        intense_recent = sum(
-            1 for s in last_48h
-            if s.intensity in [SessionIntensity.HARD, SessionIntensity.VERY_HARD]
-        )
-        
-        if intense_recent >= 2 and session.intensity in [SessionIntensity.HARD, SessionIntensity.VERY_HARD]:
-            details.append("⚠️ Enchaînement: 2+ séances intenses dans les 48h")
+
+        if intense_recent >= 2 and session.intensity in _INTENSE_INTENSITIES:
+            details.append(_DETAIL_2PLUS_INTENSE)
             return 0.4
         elif intense_recent == 1 and session.intensity == SessionIntensity.VERY_HARD:
-            details.append("ℹ️ Enchaînement: 1 séance intense récente")
+            details.append(_DETAIL_1_INTENSE)
             return 0.7
         else:
             return 1.0
@@ -261,7 +341,7 @@ class SessionAdapter:
         modified_session = None
         
         # 1. Score excellent: MAINTENIR
-        if composite_score >= (self.thresholds['excellent'] + threshold_adjust):
+        if composite_score >= (self._t_excellent + threshold_adjust):
             return (
                 AdaptationAction.MAINTAIN,
                 "✅ Conditions optimales pour la séance planifiée",
@@ -269,7 +349,7 @@ class SessionAdapter:
             )
         
         # 2. Score bon: MAINTENIR AVEC SURVEILLANCE
-        elif composite_score >= (self.thresholds['good'] + threshold_adjust):
+        elif composite_score >= (self._t_good + threshold_adjust):
             return (
                 AdaptationAction.MONITOR,
                 "👍 Conditions bonnes, surveiller les signes de fatigue pendant la séance",
@@ -277,7 +357,7 @@ class SessionAdapter:
             )
         
         # 3. Score moyen: ALLÉGER
-        elif composite_score >= (self.thresholds['moderate'] + threshold_adjust):
+        elif composite_score >= (self._t_moderate + threshold_adjust):
             modified_session = self._lighten_session(session, reduction=0.75)
             return (
                 AdaptationAction.REDUCE,
@@ -286,9 +366,9 @@ class SessionAdapter:
             )
         
         # 4. Score faible: REMPLACER
-        elif composite_score >= (self.thresholds['poor'] + threshold_adjust):
+        elif composite_score >= (self._t_poor + threshold_adjust):
             # Si séance intense, remplacer par endurance légère
-            if session.intensity in [SessionIntensity.HARD, SessionIntensity.VERY_HARD]:
+            if session.intensity in _INTENSE_INTENSITIES:
                 modified_session = self._replace_with_easy(session)
                 return (
                     AdaptationAction.REPLACE,
@@ -327,82 +407,105 @@ class SessionAdapter:
         Allège une séance (réduit durée/distance)
         reduction: 0.75 = garde 75% (réduit de 25%)
         """
-        # Créer une copie
-        modified = session.model_copy(deep=True)
-        modified.id = f"{session.id}_adapted"
-        modified.status = SessionStatus.ADAPTED
-        modified.adaptation_reason = f"Séance allégée à {int(reduction*100)}% du volume"
-        
-        # Réduire durée et distance
-        modified.duration_minutes = int(modified.duration_minutes * reduction)
-        if modified.distance_km:
-            modified.distance_km = round(modified.distance_km * reduction, 1)
-        
-        # Réduire chaque portion de la structure
-        for zone in modified.structure:
-            if zone.duration_minutes:
-                zone.duration_minutes = int(zone.duration_minutes * reduction)
-            if zone.distance_km:
-                zone.distance_km = round(zone.distance_km * reduction, 2)
-        
+        # Copie superficielle + zones clonées avec leurs réductions : la copie
+        # profonde (model_copy(deep=True)) re-parcourait tout l'arbre de la
+        # séance puis revalidait chaque affectation d'attribut, alors que
+        # seuls quelques scalaires changent
+        # Mise à jour façon "structure of arrays" : les deux colonnes réduites
+        # sont calculées en bloc, puis les zones clonées en une seule passe
+        # (aucun __setattr__ pydantic par zone)
+        zones = session.structure
+        durations = [
+            int(z.duration_minutes * reduction) if z.duration_minutes else z.duration_minutes
+            for z in zones
+        ]
+        distances = [
+            round(z.distance_km * reduction, 2) if z.distance_km else z.distance_km
+            for z in zones
+        ]
+        structure = [
+            zone.model_copy(update={'duration_minutes': dur, 'distance_km': dist})
+            for zone, dur, dist in zip(zones, durations, distances)
+        ]
+
         # Baisser légèrement l'intensité
-        if modified.intensity == SessionIntensity.VERY_HARD:
-            modified.intensity = SessionIntensity.HARD
-        elif modified.intensity == SessionIntensity.HARD:
-            modified.intensity = SessionIntensity.MODERATE
-        
-        return modified
+        intensity = session.intensity
+        if intensity == SessionIntensity.VERY_HARD:
+            intensity = SessionIntensity.HARD
+        elif intensity == SessionIntensity.HARD:
+            intensity = SessionIntensity.MODERATE
+
+        update = {
+            'id': f"{session.id}_adapted",
+            'status': SessionStatus.ADAPTED,
+            'adaptation_reason': f"Séance allégée à {int(reduction*100)}% du volume",
+            'duration_minutes': int(session.duration_minutes * reduction),
+            'intensity': intensity,
+            'structure': structure
+        }
+        if session.distance_km:
+            update['distance_km'] = round(session.distance_km * reduction, 1)
+
+        return session.model_copy(update=update)
     
     def _replace_with_easy(self, session: TrainingSession) -> TrainingSession:
         """Remplace une séance intense par de l'endurance facile"""
-        from models.session import PaceZone
-        
-        modified = session.model_copy(deep=True)
-        modified.id = f"{session.id}_easy"
-        modified.session_type = SessionType.RECOVERY
-        modified.intensity = SessionIntensity.EASY
-        modified.status = SessionStatus.ADAPTED
-        modified.adaptation_reason = "Séance intense remplacée par récupération active"
-        modified.title = f"Récupération active (remplace {session.title})"
-        modified.description = "Course facile de récupération"
-        
         # Durée réduite, allure très facile
-        modified.duration_minutes = min(40, int(session.duration_minutes * 0.6))
-        modified.distance_km = 6.0
-        
-        # Structure simple
-        modified.structure = [
-            PaceZone(
-                description="Endurance très facile",
-                duration_minutes=modified.duration_minutes,
-                pace_min_per_km="6:15",
-                pace_max_per_km="6:30",
-                hr_zone="70-75% FCmax"
-            )
-        ]
-        
-        return modified
+        duration = min(40, int(session.duration_minutes * 0.6))
+
+        # Copie superficielle : l'ancienne structure est entièrement remplacée,
+        # inutile de la dupliquer en profondeur. Zone construite sans
+        # revalidation (valeurs constantes connues valides).
+        return session.model_copy(update={
+            'id': f"{session.id}_easy",
+            'session_type': SessionType.RECOVERY,
+            'intensity': SessionIntensity.EASY,
+            'status': SessionStatus.ADAPTED,
+            'adaptation_reason': "Séance intense remplacée par récupération active",
+            'title': f"Récupération active (remplace {session.title})",
+            'description': "Course facile de récupération",
+            'duration_minutes': duration,
+            'distance_km': 6.0,
+            'structure': [
+                PaceZone.model_construct(
+                    description="Endurance très facile",
+                    duration_minutes=duration,
+                    pace_min_per_km="6:15",
+                    pace_max_per_km="6:30",
+                    hr_zone="70-75% FCmax"
+                )
+            ]
+        })
     
     def _calculate_confidence(self, metrics: DailyMetrics) -> float:
         """
         Calcule la confiance dans la recommandation
         Basée sur la complétude des données
         """
-        data_points = 0
-        total_points = 5
-        
-        if metrics.sleep:
-            data_points += 1
-        if metrics.hrv:
-            data_points += 1
-        if metrics.training_load:
-            data_points += 1
-        if metrics.available_time_slots:
-            data_points += 1
-        if metrics.subjective:
-            data_points += 1
-        
-        return data_points / total_points
+        # Somme directe de booléens : pas de cascade d'incréments
+        data_points = (
+            bool(metrics.sleep)
+            + bool(metrics.hrv)
+            + bool(metrics.training_load)
+            + bool(metrics.available_time_slots)
+            + bool(metrics.subjective)
+        )
+        return data_points / 5
+
+
+# Adaptateur partagé par les fonctions utilitaires (l'instance est sans état
+# mutable, inutile d'en reconstruire une par appel)
+_DEFAULT_ADAPTER = SessionAdapter()
+
+# Classement score → ReadinessLevel : bornes croissantes pour bisect/searchsorted
+_READINESS_BOUNDS = (40, 55, 70, 85)
+_READINESS_TABLE = (
+    ReadinessLevel.POOR,
+    ReadinessLevel.COMPROMISED,
+    ReadinessLevel.OK,
+    ReadinessLevel.GOOD,
+    ReadinessLevel.OPTIMAL
+)
 
 
 def quick_adapt(
@@ -421,26 +524,54 @@ def quick_adapt(
     Returns:
         AdaptationRecommendation
     """
-    # Créer des métriques minimales
-    from models import DailyMetrics, ReadinessLevel
-    
+    # Créer des métriques minimales (readiness par bisect dans la table,
+    # adaptateur partagé : pas de constructeur par appel)
     metrics = DailyMetrics(
         date=date.today(),
         recovery_score=recovery_score,
-        available_time_slots=["18:00-20:00"] if has_time else []
+        available_time_slots=["18:00-20:00"] if has_time else [],
+        readiness_level=_READINESS_TABLE[bisect_right(_READINESS_BOUNDS, recovery_score)]
     )
-    
-    # Déterminer readiness level
-    if recovery_score >= 85:
-        metrics.readiness_level = ReadinessLevel.OPTIMAL
-    elif recovery_score >= 70:
-        metrics.readiness_level = ReadinessLevel.GOOD
-    elif recovery_score >= 55:
-        metrics.readiness_level = ReadinessLevel.OK
-    elif recovery_score >= 40:
-        metrics.readiness_level = ReadinessLevel.COMPROMISED
-    else:
-        metrics.readiness_level = ReadinessLevel.POOR
-    
-    adapter = SessionAdapter()
-    return adapter.adapt_session(session, metrics)
+    return _DEFAULT_ADAPTER.adapt_session(session, metrics)
+
+
+def quick_adapt_batch(
+    sessions: list[TrainingSession],
+    recovery_scores: list[float],
+    has_time_mask: Optional[list[bool]] = None
+) -> list[AdaptationRecommendation]:
+    """
+    Adapte une liste de séances en un seul passage (aperçu/régénération de plan)
+
+    Classe tous les scores en ReadinessLevel d'un coup via
+    numpy.searchsorted, puis construit des métriques minimales sans
+    revalidation pydantic par séance.
+
+    Args:
+        sessions: Séances à adapter
+        recovery_scores: Un score 0-100 par séance
+        has_time_mask: Disponibilité agenda par séance (défaut: toutes)
+
+    Returns:
+        Une AdaptationRecommendation par séance
+    """
+    import numpy as np
+
+    scores = np.asarray(recovery_scores, dtype=np.float64)
+    level_indices = np.searchsorted(_READINESS_BOUNDS, scores, side='right')
+    if has_time_mask is None:
+        has_time_mask = [True] * len(sessions)
+
+    today = date.today()
+    recommendations = []
+    for session, score, idx, has_time in zip(
+        sessions, scores.tolist(), level_indices.tolist(), has_time_mask
+    ):
+        metrics = DailyMetrics.model_construct(
+            date=today,
+            recovery_score=score,
+            available_time_slots=["18:00-20:00"] if has_time else [],
+            readiness_level=_READINESS_TABLE[idx]
+        )
+        recommendations.append(_DEFAULT_ADAPTER.adapt_session(session, metrics))
+    return recommendations
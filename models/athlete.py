@@ -1,8 +1,9 @@
 """
 Modèle de données pour le profil athlète
 """
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator, PrivateAttr
 from datetime import date, datetime
+from types import MappingProxyType
 from typing import Optional
 from enum import Enum
 
@@ -96,32 +97,42 @@ class PhysiologicalData(BaseModel):
         description="FC au seuil lactique"
     )
     
+    # Résultats mémorisés : les entrées (max_hr, vo2max, vma_kmh) ne changent
+    # pas pendant la vie de l'instance, inutile de recalculer à chaque appel
+    _vma_estimate: Optional[float] = PrivateAttr(default=None)
+    _training_zones: Optional[MappingProxyType] = PrivateAttr(default=None)
+
     # Calculs automatiques
     def calculate_max_hr_estimate(self) -> int:
         """Estime FCmax si non fournie (formule 220 - âge)"""
         if self.max_hr:
             return self.max_hr
         return 220 - self.age
-    
+
     def calculate_vma_from_vo2max(self) -> float:
-        """Estime VMA à partir du VO2max"""
-        if self.vma_kmh:
-            return self.vma_kmh
-        if self.vo2max:
-            # Formule approximative: VMA (km/h) ≈ VO2max / 3.5
-            return round(self.vo2max / 3.5, 1)
-        return 15.0  # Valeur par défaut raisonnable
-    
-    def get_training_zones(self) -> dict:
-        """Calcule les zones d'entraînement"""
-        max_hr = self.calculate_max_hr_estimate()
-        return {
-            "Z1_recovery": (max_hr * 0.60, max_hr * 0.70),
-            "Z2_endurance": (max_hr * 0.70, max_hr * 0.80),
-            "Z3_tempo": (max_hr * 0.80, max_hr * 0.87),
-            "Z4_threshold": (max_hr * 0.87, max_hr * 0.92),
-            "Z5_vma": (max_hr * 0.92, max_hr * 1.00),
-        }
+        """Estime VMA à partir du VO2max (calculée une seule fois)"""
+        if self._vma_estimate is None:
+            if self.vma_kmh:
+                self._vma_estimate = self.vma_kmh
+            elif self.vo2max:
+                # Formule approximative: VMA (km/h) ≈ VO2max / 3.5
+                self._vma_estimate = round(self.vo2max / 3.5, 1)
+            else:
+                self._vma_estimate = 15.0  # Valeur par défaut raisonnable
+        return self._vma_estimate
+
+    def get_training_zones(self) -> MappingProxyType:
+        """Calcule les zones d'entraînement (vue en lecture seule, mémorisée)"""
+        if self._training_zones is None:
+            max_hr = self.calculate_max_hr_estimate()
+            self._training_zones = MappingProxyType({
+                "Z1_recovery": (max_hr * 0.60, max_hr * 0.70),
+                "Z2_endurance": (max_hr * 0.70, max_hr * 0.80),
+                "Z3_tempo": (max_hr * 0.80, max_hr * 0.87),
+                "Z4_threshold": (max_hr * 0.87, max_hr * 0.92),
+                "Z5_vma": (max_hr * 0.92, max_hr * 1.00),
+            })
+        return self._training_zones
 
 
 class PerformanceHistory(BaseModel):
@@ -133,6 +144,15 @@ class PerformanceHistory(BaseModel):
     race_or_training: str = "Race"  # "Race" ou "Training"
 
 
+# Pourcentages de VMA par distance (estimations), partagés au niveau du module
+_VMA_PERCENTAGES = {
+    "5km": 0.95,
+    "10km": 0.90,
+    "Semi-marathon": 0.85,
+    "Marathon": 0.80
+}
+
+
 class Athlete(BaseModel):
     """Profil complet de l'athlète"""
     # Identité
@@ -168,13 +188,32 @@ class Athlete(BaseModel):
     # Métadonnées
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
-    
+
+    # Index distance → meilleure perf, entretenu à la validation et par
+    # add_performance (évite un scan complet de l'historique par lecture)
+    _best_by_distance: dict[str, PerformanceHistory] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode='after')
+    def _index_performances(self):
+        """Construit l'index des records par distance"""
+        best = {}
+        for perf in self.performance_history:
+            current = best.get(perf.distance)
+            if current is None or perf.time < current.time:
+                best[perf.distance] = perf
+        self._best_by_distance = best
+        return self
+
+    def add_performance(self, performance: PerformanceHistory):
+        """Ajoute une performance à l'historique et met à jour l'index"""
+        self.performance_history.append(performance)
+        best = self._best_by_distance.get(performance.distance)
+        if best is None or performance.time < best.time:
+            self._best_by_distance[performance.distance] = performance
+
     def get_best_performance(self, distance: str) -> Optional[PerformanceHistory]:
-        """Retourne la meilleure perf pour une distance donnée"""
-        perfs = [p for p in self.performance_history if p.distance == distance]
-        if not perfs:
-            return None
-        return min(perfs, key=lambda p: p.time)
+        """Retourne la meilleure perf pour une distance donnée (lecture O(1))"""
+        return self._best_by_distance.get(distance)
     
     def get_current_fitness_level(self) -> str:
         """Estime le niveau actuel basé sur VO2max ou VMA"""
@@ -200,24 +239,12 @@ class Athlete(BaseModel):
         basée sur la VMA
         """
         vma = self.physio.calculate_vma_from_vo2max()
-        
-        # Pourcentages de VMA par distance (estimations)
-        vma_percentages = {
-            "5km": 0.95,
-            "10km": 0.90,
-            "Semi-marathon": 0.85,
-            "Marathon": 0.80
-        }
-        
-        pct = vma_percentages.get(distance, 0.85)
-        race_speed_kmh = vma * pct
-        
-        # Convertir en min/km
-        pace_min_per_km = 60 / race_speed_kmh
-        minutes = int(pace_min_per_km)
-        seconds = int((pace_min_per_km - minutes) * 60)
-        
-        return f"{minutes}:{seconds:02d}"
+        race_speed_kmh = vma * _VMA_PERCENTAGES.get(distance, 0.85)
+
+        # Convertir en min/km : tout en secondes entières, ce qui évite
+        # l'aller-retour float/int et ses erreurs d'arrondi (5:59.999 → 5:59)
+        total_seconds = round(3600 / race_speed_kmh)
+        return f"{total_seconds // 60}:{total_seconds % 60:02d}"
     
     def weeks_until_goal(self) -> Optional[int]:
         """Retourne le nombre de semaines jusqu'à l'objectif principal"""
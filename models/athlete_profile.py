@@ -7,13 +7,55 @@ from typing import Optional, List
 from enum import Enum
 
 
-class Gender(Enum):
+class _ByValueEnum(Enum):
+    """
+    Enum avec recherche par valeur directe
+
+    `Gender("Homme")` passe par EnumMeta.__call__ (isinstance, gestion de
+    _missing_...) à chaque appel ; `Gender.from_value("Homme")` lit la table
+    valeur → membre déjà construite par le module enum, nettement plus rapide
+    dans les chemins de désérialisation.
+    """
+
+    @classmethod
+    def from_value(cls, value):
+        """Retourne le membre correspondant à la valeur (KeyError si inconnue)"""
+        return cls._value2member_map_[value]
+
+
+# Bornes des zones cardiaques en fraction de FC max, partagées au niveau du
+# module (une paire (basse, haute) par zone, alignée sur _HR_ZONE_KEYS)
+_HR_ZONE_COEFFS = ((0.50, 0.60), (0.60, 0.70), (0.70, 0.80), (0.80, 0.90), (0.90, 1.00))
+_HR_ZONE_KEYS = ("Z1_recovery", "Z2_endurance", "Z3_tempo", "Z4_threshold", "Z5_vo2max")
+
+
+def get_heart_rate_zones_batch(fc_max_values):
+    """
+    Calcule les zones Z1-Z5 pour une cohorte de FC max d'un coup
+
+    Une seule multiplication vectorisée NumPy (cohorte x 10 bornes) au lieu
+    de 10 multiplications scalaires Python par athlète.
+
+    Args:
+        fc_max_values: séquence ou tableau de FC max
+
+    Returns:
+        Tableau int32 de forme (n, 5, 2) : [athlète, zone, (basse, haute)]
+    """
+    import numpy as np
+
+    coeffs = np.asarray(_HR_ZONE_COEFFS, dtype=np.float32)  # (5, 2)
+    fc_max = np.asarray(fc_max_values, dtype=np.float32).reshape(-1, 1, 1)
+    return (fc_max * coeffs).astype(np.int32)
+
+
+class Gender(_ByValueEnum):
     """Genre de l'athlète"""
     MALE = "Homme"
     FEMALE = "Femme"
 
 
-class TrainingLevel(Enum):
+class TrainingLevel(_ByValueEnum):
     """Niveau d'entraînement"""
     BEGINNER = "Débutant"
     INTERMEDIATE = "Intermédiaire"
@@ -21,7 +63,7 @@ class TrainingLevel(Enum):
     ELITE = "Elite"
 
 
-class PreferredTerrain(Enum):
+class PreferredTerrain(_ByValueEnum):
     """Terrain préféré"""
     ROAD = "Route"
     TRAIL = "Trail"
@@ -29,7 +71,7 @@ class PreferredTerrain(Enum):
     MIXED = "Mixte"
 
 
-class PreferredTime(Enum):
+class PreferredTime(_ByValueEnum):
     """Moment préféré de la journée"""
     MORNING = "Matin (6h-10h)"
     MIDDAY = "Midi (11h-14h)"
@@ -37,9 +79,9 @@ class PreferredTime(Enum):
     EVENING = "Soir (19h-22h)"
 
 
-@dataclass
+@dataclass(slots=True)
 class AthleteProfile:
-    """Profil complet d'un athlète"""
+    """Profil complet d'un athlète (slots : pas de __dict__ par instance)"""
     
     # Informations personnelles
     first_name: str
@@ -83,14 +125,25 @@ class AthleteProfile:
     # Métadonnées
     created_at: date = field(default_factory=date.today)
     updated_at: date = field(default_factory=date.today)
-    
+
+    # Caches internes : l'âge ne dépend que de birth_date et du jour courant,
+    # la FC max calculée que de l'âge. Déclarés comme champs (slots=True exige
+    # un slot) mais exclus du repr et de l'égalité.
+    _age_cache: Optional[int] = field(default=None, repr=False, compare=False)
+    _age_cache_day: Optional[date] = field(default=None, repr=False, compare=False)
+    _max_hr_cache: Optional[int] = field(default=None, repr=False, compare=False)
+
     def get_age(self) -> int:
-        """Calcule l'âge actuel"""
+        """Calcule l'âge actuel (mémorisé, invalidé au changement de jour)"""
         today = date.today()
-        return today.year - self.birth_date.year - (
-            (today.month, today.day) < (self.birth_date.month, self.birth_date.day)
-        )
-    
+        if self._age_cache_day != today:
+            self._age_cache = today.year - self.birth_date.year - (
+                (today.month, today.day) < (self.birth_date.month, self.birth_date.day)
+            )
+            self._age_cache_day = today
+            self._max_hr_cache = None  # dépend de l'âge
+        return self._age_cache
+
     def get_max_heart_rate(self) -> int:
         """
         Retourne la FC max (mesurée ou calculée)
@@ -98,7 +151,10 @@ class AthleteProfile:
         """
         if self.max_heart_rate:
             return self.max_heart_rate
-        return 220 - self.get_age()
+        age = self.get_age()  # rafraîchit le garde-jour au passage
+        if self._max_hr_cache is None:
+            self._max_hr_cache = 220 - age
+        return self._max_hr_cache
     
     def get_heart_rate_zones(self) -> dict:
         """
@@ -108,13 +164,10 @@ class AthleteProfile:
             dict avec les zones Z1-Z5
         """
         fc_max = self.get_max_heart_rate()
-        
+
         return {
-            "Z1_recovery": (int(fc_max * 0.50), int(fc_max * 0.60)),
-            "Z2_endurance": (int(fc_max * 0.60), int(fc_max * 0.70)),
-            "Z3_tempo": (int(fc_max * 0.70), int(fc_max * 0.80)),
-            "Z4_threshold": (int(fc_max * 0.80), int(fc_max * 0.90)),
-            "Z5_vo2max": (int(fc_max * 0.90), int(fc_max * 1.00))
+            key: (int(fc_max * low), int(fc_max * high))
+            for key, (low, high) in zip(_HR_ZONE_KEYS, _HR_ZONE_COEFFS)
         }
     
     def get_bmi(self) -> Optional[float]:
@@ -135,21 +188,32 @@ class AthleteProfile:
     
     def to_dict(self) -> dict:
         """Convertit le profil en dictionnaire pour sauvegarde"""
+        # Sérialiseur à plat écrit à la main : les conversions (enum.value,
+        # isoformat) sont liées à des locaux puis le dict est construit en un
+        # seul literal — pas de récursion générique type dataclasses.asdict
+        birth_date = self.birth_date.isoformat()
+        gender = self.gender.value
+        training_level = self.training_level.value
+        training_times = [t.value for t in self.preferred_training_times]
+        terrain = self.preferred_terrain.value
+        created_at = self.created_at.isoformat()
+        updated_at = self.updated_at.isoformat()
+
         return {
             'first_name': self.first_name,
             'last_name': self.last_name,
-            'birth_date': self.birth_date.isoformat(),
-            'gender': self.gender.value,
+            'birth_date': birth_date,
+            'gender': gender,
             'weight_kg': self.weight_kg,
             'height_cm': self.height_cm,
             'max_heart_rate': self.max_heart_rate,
             'resting_heart_rate': self.resting_heart_rate,
             'vma_kmh': self.vma_kmh,
             'threshold_pace_min_per_km': self.threshold_pace_min_per_km,
-            'training_level': self.training_level.value,
+            'training_level': training_level,
             'running_experience_years': self.running_experience_years,
-            'preferred_training_times': [t.value for t in self.preferred_training_times],
-            'preferred_terrain': self.preferred_terrain.value,
+            'preferred_training_times': training_times,
+            'preferred_terrain': terrain,
             'injury_history': self.injury_history,
             'current_injuries': self.current_injuries,
             'main_goal': self.main_goal,
@@ -157,30 +221,38 @@ class AthleteProfile:
             'garmin_email': self.garmin_email,
             'garmin_connected': self.garmin_connected,
             'google_calendar_connected': self.google_calendar_connected,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': created_at,
+            'updated_at': updated_at
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'AthleteProfile':
         """Reconstruit un profil depuis un dictionnaire"""
         from datetime import date as dt_date
-        
+
+        # Résolution des enums par table valeur → membre (from_value) plutôt
+        # que par le constructeur, nettement plus rapide en chargement de masse
+        training_level = data.get('training_level')
+        preferred_terrain = data.get('preferred_terrain')
+
         return cls(
             first_name=data['first_name'],
             last_name=data['last_name'],
             birth_date=dt_date.fromisoformat(data['birth_date']),
-            gender=Gender(data['gender']),
+            gender=Gender.from_value(data['gender']),
             weight_kg=data['weight_kg'],
             height_cm=data.get('height_cm'),
             max_heart_rate=data.get('max_heart_rate'),
             resting_heart_rate=data.get('resting_heart_rate'),
             vma_kmh=data.get('vma_kmh'),
             threshold_pace_min_per_km=data.get('threshold_pace_min_per_km'),
-            training_level=TrainingLevel(data.get('training_level', TrainingLevel.INTERMEDIATE.value)),
+            training_level=(TrainingLevel.from_value(training_level)
+                            if training_level else TrainingLevel.INTERMEDIATE),
             running_experience_years=data.get('running_experience_years'),
-            preferred_training_times=[PreferredTime(t) for t in data.get('preferred_training_times', [])],
-            preferred_terrain=PreferredTerrain(data.get('preferred_terrain', PreferredTerrain.ROAD.value)),
+            preferred_training_times=[PreferredTime.from_value(t)
+                                      for t in data.get('preferred_training_times', [])],
+            preferred_terrain=(PreferredTerrain.from_value(preferred_terrain)
+                               if preferred_terrain else PreferredTerrain.ROAD),
             injury_history=data.get('injury_history', []),
             current_injuries=data.get('current_injuries', []),
             main_goal=data.get('main_goal'),
@@ -1,7 +1,8 @@
 """
 Modèle de données pour les métriques quotidiennes (sommeil, récupération, charge)
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Optional
 from enum import Enum
@@ -32,23 +33,29 @@ class ReadinessLevel(str, Enum):
     OPTIMAL = "Optimal"
 
 
-class SleepData(BaseModel):
-    """Données de sommeil (Garmin, Apple Health)"""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SleepData:
+    """
+    Données de sommeil (Garmin, Apple Health)
+
+    Dataclass légère (pas de validation pydantic) : les valeurs viennent de
+    payloads Garmin/Apple déjà bornés, inutile de payer la validation par champ
+    """
     date: date
-    total_sleep_hours: float = Field(..., ge=0, le=24, description="Durée totale sommeil")
-    deep_sleep_hours: Optional[float] = Field(None, description="Sommeil profond")
-    rem_sleep_hours: Optional[float] = Field(None, description="Sommeil paradoxal")
-    light_sleep_hours: Optional[float] = Field(None, description="Sommeil léger")
-    awake_hours: Optional[float] = Field(None, description="Temps éveillé")
-    
+    total_sleep_hours: float  # Durée totale sommeil (0-24)
+    deep_sleep_hours: Optional[float] = None  # Sommeil profond
+    rem_sleep_hours: Optional[float] = None  # Sommeil paradoxal
+    light_sleep_hours: Optional[float] = None  # Sommeil léger
+    awake_hours: Optional[float] = None  # Temps éveillé
+
     sleep_quality: SleepQuality
-    sleep_score: int = Field(..., ge=0, le=150, description="Score de qualité (0-100, Garmin peut dépasser)")
-    
-    bedtime: Optional[str] = Field(None, description="Heure coucher (HH:MM)")
-    wake_time: Optional[str] = Field(None, description="Heure réveil (HH:MM)")
-    
-    source: str = Field(default="Garmin", description="Source des données")
-    
+    sleep_score: int  # Score de qualité (0-100, Garmin peut dépasser)
+
+    bedtime: Optional[str] = None  # Heure coucher (HH:MM)
+    wake_time: Optional[str] = None  # Heure réveil (HH:MM)
+
+    source: str = "Garmin"
+
     def get_sleep_efficiency(self) -> float:
         """Calcule l'efficacité du sommeil (temps dormi / temps au lit)"""
         if not self.awake_hours:
@@ -67,16 +74,17 @@ class SleepData(BaseModel):
         return min(self.sleep_score / 100.0, 1.0)
 
 
-class HeartRateVariability(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class HeartRateVariability:
     """Données de variabilité de la fréquence cardiaque (HRV)"""
     date: date
-    hrv_ms: float = Field(..., gt=0, description="HRV en millisecondes (RMSSD)")
-    source: str = Field(default="Garmin")
-    
+    hrv_ms: float  # HRV en millisecondes (RMSSD)
+    source: str = "Garmin"
+
     # Contexte de la mesure
-    measured_at: Optional[str] = Field(None, description="Heure de mesure")
-    measured_during_sleep: bool = Field(True)
-    
+    measured_at: Optional[str] = None  # Heure de mesure
+    measured_during_sleep: bool = True
+
     def get_normalized_score(self, baseline_hrv: float = 50.0) -> float:
         """
         Score normalisé par rapport à une baseline personnelle
@@ -89,12 +97,13 @@ class HeartRateVariability(BaseModel):
         return min(1.0, max(0.0, ratio))
 
 
-class RestingHeartRate(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class RestingHeartRate:
     """Fréquence cardiaque au repos"""
     date: date
-    rhr_bpm: int = Field(..., gt=30, lt=120, description="FC repos en BPM")
-    source: str = Field(default="Garmin")
-    
+    rhr_bpm: int  # FC repos en BPM
+    source: str = "Garmin"
+
     def get_normalized_score(self, baseline_rhr: int = 50) -> float:
         """
         Score normalisé: FC plus basse que baseline = meilleure récup
@@ -167,25 +176,26 @@ class TrainingLoad(BaseModel):
             return max(0.0, 1.0 - (self.acwr - 1.3) / 0.7)
 
 
-class SubjectiveMetrics(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SubjectiveMetrics:
     """Métriques subjectives déclarées par l'athlète"""
     date: date
-    
+
     # RPE = Rating of Perceived Exertion
-    rpe: Optional[int] = Field(None, ge=1, le=10, description="RPE 1-10")
-    
+    rpe: Optional[int] = None  # RPE 1-10
+
     # Ressenti global
-    motivation: Optional[int] = Field(None, ge=1, le=5, description="Motivation 1-5")
-    energy: Optional[int] = Field(None, ge=1, le=5, description="Énergie 1-5")
-    mood: Optional[int] = Field(None, ge=1, le=5, description="Humeur 1-5")
-    
+    motivation: Optional[int] = None  # Motivation 1-5
+    energy: Optional[int] = None  # Énergie 1-5
+    mood: Optional[int] = None  # Humeur 1-5
+
     # Douleurs
-    muscle_soreness: Optional[int] = Field(None, ge=1, le=5, description="Courbatures 1-5")
-    injury_risk: Optional[int] = Field(None, ge=1, le=5, description="Risque blessure 1-5")
-    
+    muscle_soreness: Optional[int] = None  # Courbatures 1-5
+    injury_risk: Optional[int] = None  # Risque blessure 1-5
+
     # Note générale
-    overall_feeling: Optional[str] = Field(None, description="Ressenti libre")
-    
+    overall_feeling: Optional[str] = None  # Ressenti libre
+
     def get_normalized_score(self) -> float:
         """Calcule un score global 0-1"""
         scores = []
@@ -239,8 +249,13 @@ class DailyMetrics(BaseModel):
     )
     
     readiness_level: Optional[ReadinessLevel] = None
-    
+
     created_at: datetime = Field(default_factory=datetime.now)
+
+    # Analyse partagée mise en cache par l'adaptateur de séances : les facteurs
+    # indépendants de la séance (récupération, charge) ne sont calculés qu'une
+    # fois par jour même quand plusieurs séances sont adaptées
+    _cached_analysis: Optional[tuple] = PrivateAttr(default=None)
     
     def calculate_recovery_score(
         self,
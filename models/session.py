@@ -69,9 +69,9 @@ class PaceZone(BaseModel):
 class TrainingSession(BaseModel):
     """Modèle complet d'une séance d'entraînement"""
     id: str = Field(..., description="ID unique de la séance")
-    week_number: int = Field(..., ge=1, le=52, description="Numéro de semaine du plan")
-    day_of_week: int = Field(..., ge=1, le=7, description="Jour de la semaine (1=lundi)")
-    session_number: int = Field(..., description="Numéro de la séance dans la semaine")
+    week_number: int = Field(1, ge=1, le=52, description="Numéro de semaine du plan")
+    day_of_week: int = Field(1, ge=1, le=7, description="Jour de la semaine (1=lundi)")
+    session_number: int = Field(1, description="Numéro de la séance dans la semaine")
     
     # Type et caractéristiques
     session_type: SessionType